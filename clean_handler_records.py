@@ -81,7 +81,8 @@ def main():
 
     key_pattern = f"*:{arguments.application_name}:*"
 
-    for possible_key in connection.keys(key_pattern):
+    # SCAN walks the keyspace in steps rather than blocking the server the way KEYS does
+    for possible_key in connection.scan_iter(match=key_pattern, count=1000):
         possible_key = possible_key.decode()
 
         if not MESSAGE_HANDLER_PATTERN.search(possible_key):
@@ -90,13 +90,8 @@ def main():
 
     connection = Redis()
 
-    all_keys = connection.keys("*")
-
-    streams: typing.List[bytes] = list()
-
-    for key in all_keys:
-        if connection.type(key) == STREAM_TYPE:
-            streams.append(key)
+    # SCAN filters by type on the server and walks the keyspace in steps rather than blocking it like KEYS does
+    streams: typing.List[bytes] = list(connection.scan_iter(count=1000, _type=STREAM_TYPE.decode()))
 
     for stream in streams:
         stream_groups: typing.List[typing.Dict[str, typing.Optional[typing.Union[bytes, int]]]] = connection.xinfo_groups(stream)
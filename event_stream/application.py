@@ -12,11 +12,16 @@ from argparse import ArgumentParser
 
 from configuration import EventBusConfigurations
 from event_stream.streams.bus import EventBus
+from event_stream.streams.reader import EventStreamReader
 from event_stream.streams.handlers import HandlerReader
 from event_stream.streams.handlers import create_master_handlers
+from event_stream.utilities.communication import install_fast_event_loop
 
 
 class Arguments(object):
+    # Arguments are set once and only read afterwards, so instances don't need a `__dict__`
+    __slots__ = ("__path", "__verbose", "__validate")
+
     def __init__(self, *args):
         # Replace '__option' with any of the expected arguments
         self.__path: typing.Optional[pathlib.Path] = None
@@ -73,7 +78,8 @@ class Arguments(object):
         self.__verbose = parameters.verbose
         self.__validate = parameters.validate
 
-        if not (self.__path.exists() and self.__path.is_file()):
+        # `is_file` is already False for paths that don't exist, so there's no need to check for existence first
+        if not self.__path.is_file():
             raise ValueError(f"A configuration file could not be found at {str(self.__path)}")
 
 
@@ -89,18 +95,17 @@ async def main():
         print(f"The configuration at '{arguments.path}' was valid")
         exit(0)
 
-    listeners = list()
-
-    for bus_configuration in configuration.busses:
-        bus = EventBus(configuration=bus_configuration, verbose=arguments.verbose)
-        listeners.append(bus)
-
-    for handler_configuration in configuration.handlers:
-        handler = HandlerReader(configuration=handler_configuration, verbose=arguments.verbose)
-        listeners.append(handler)
-
-    listeners.extend(
-        create_master_handlers(
+    # The collection of listeners never changes once built, so it may be a tuple
+    listeners: typing.Tuple[EventStreamReader, ...] = (
+        *(
+            EventBus(configuration=bus_configuration, verbose=arguments.verbose)
+            for bus_configuration in configuration.busses
+        ),
+        *(
+            HandlerReader(configuration=handler_configuration, verbose=arguments.verbose)
+            for handler_configuration in configuration.handlers
+        ),
+        *create_master_handlers(
             application_name=configuration.application_name,
             application_instance=configuration.application_identifier,
             stream_name=settings.master_stream,
@@ -113,14 +118,19 @@ async def main():
         for bus in listeners
     ]
 
-    try:
-        complete_listening_tasks, pending_listening_tasks = await asyncio.wait(
-            listener_tasks,
-            return_when=asyncio.FIRST_COMPLETED
-        )
-    except BaseException as e:
-        pass
+    # All listeners end when one ends
+    await asyncio.wait(listener_tasks, return_when=asyncio.FIRST_COMPLETED)
+    await asyncio.gather(*[listener.close() for listener in listeners])
+
+    # Every listener task is awaited so that none are left dangling. Closed listeners end up cancelled, which isn't
+    # an error, but anything else that went wrong in a listener should not be swallowed
+    results = await asyncio.gather(*listener_tasks, return_exceptions=True)
+    listener_errors = [result for result in results if isinstance(result, Exception)]
+
+    if listener_errors:
+        raise listener_errors[0]
 
 
 if __name__ == "__main__":
+    install_fast_event_loop()
     asyncio.run(main())
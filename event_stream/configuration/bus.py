@@ -17,6 +17,7 @@ from . import group
 from .communication import ListenerConfiguration
 from .parts import CodeDesignation
 from event_stream.utilities.common import generate_identifier
+from event_stream.utilities.common import load_json
 from event_stream.system import settings
 
 
@@ -29,10 +30,7 @@ class EventBusConfiguration(ListenerConfiguration):
         return event_name in self.handlers
 
     def get_tracker_ids(self, event_name: str) -> typing.Iterable[str]:
-        if event_name in self.handlers:
-            return [handler.tracker_id for handler in self.get_handlers(event_name=event_name)]
-        else:
-            return list()
+        return [handler.tracker_id for handler in self.get_handlers(event_name=event_name)]
 
     @classmethod
     def get_parent_collection_name(cls) -> str:
@@ -42,8 +40,9 @@ class EventBusConfiguration(ListenerConfiguration):
         description="Lists of event handlers mapped to their event name"
     )
 
-    def get_handlers(self, event_name: str) -> typing.List[CodeDesignation]:
-        return self.handlers.get(event_name, list())
+    def get_handlers(self, event_name: str) -> typing.Sequence[CodeDesignation]:
+        # Return a shared empty tuple for unknown events rather than building a new list for every miss
+        return self.handlers.get(event_name, ())
 
     def __str__(self):
         return f"{self.name} => {self.stream if self.stream else '<global stream>'}:{self.group}"
@@ -120,6 +119,10 @@ class EventBusConfigurations(BaseModel):
     """
     A set of different event busses for different channels
     """
+    class Config:
+        # Use orjson to parse configuration files if it is available - it is significantly faster than `json`
+        json_loads = load_json
+
     @classmethod
     def from_listener(cls, listener: ListenerConfiguration) -> EventBusConfigurations:
         configuration = {
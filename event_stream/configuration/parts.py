@@ -1,12 +1,15 @@
 """
 Provides base classes and mixins for Pydantic Models
 """
+import functools
 import inspect
 import json
 import typing
 import os
 import typing_extensions
 
+from types import MappingProxyType
+
 from pydantic import BaseModel
 from pydantic import Field
 from pydantic import PrivateAttr
@@ -20,6 +23,44 @@ from event_stream import messages
 from event_stream.system import logging
 
 
+class _CodeLocation(typing.NamedTuple):
+    """
+    The bare description of where code lives, used to share loaded code between designations
+    """
+    module_name: str
+    name: str
+
+
+@functools.lru_cache(maxsize=None)
+def _load_message_type(location: _CodeLocation) -> typing.Type[types.MessageProtocol]:
+    """
+    Find a message type. Results are shared so that copies and reloads of a configuration don't search again
+
+    Args:
+        location: Where the message type lives
+
+    Returns:
+        The found message type
+    """
+    return types.get_code(location, types.MessageProtocol)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_handler(location: _CodeLocation) -> types.HANDLER_FUNCTION:
+    """
+    Find and validate a handler. Results are shared so that copies and reloads of a configuration don't search again
+
+    Args:
+        location: Where the handler lives
+
+    Returns:
+        The found handler
+    """
+    function = types.get_code(location)
+    types.enforce_handler(function)
+    return function
+
+
 class PasswordEnabled:
     """
     A mixin for adding functionality for retrieving a password
@@ -84,7 +125,7 @@ class MessageDesignation(BaseModel):
 
     @classmethod
     def from_message_type(cls, message_type: typing.Type):
-        if not issubclass(message_type, types.MessageProtocol):
+        if not types.is_message(message_type):
             raise ValueError(f"A '{str(message_type)}' is not a valid message type")
 
         module_name = inspect.getmodule(message_type).__name__
@@ -97,12 +138,12 @@ class MessageDesignation(BaseModel):
 
     def parse(self, data: typing.Union[str, bytes, typing.Mapping]) -> messages.Message:
         if self.__found_message_type is None:
-            self.__found_message_type = types.get_code(self, types.MessageProtocol)
+            self.__found_message_type = _load_message_type(_CodeLocation(self.module_name, self.name))
 
         return self.__found_message_type.parse(data=data)
 
     def set_message_type(self, message_type: typing.Type):
-        if isinstance(message_type, types.MessageProtocol):
+        if types.is_message(message_type):
             self.__found_message_type = message_type
         else:
             raise ValueError(f"A '{str(message_type)}' is not a valid message type")
@@ -147,6 +188,12 @@ class CodeDesignation(BaseModel, types.HANDLER_FUNCTION):
 
     __loaded_function: types.HANDLER_FUNCTION = PrivateAttr(None)
 
+    __description: typing.Optional[str] = PrivateAttr(None)
+    """A cached description of the designation - this is used as an identifier, so it is requested often"""
+
+    __hash_value: typing.Optional[int] = PrivateAttr(None)
+    """A cached hash for the designation"""
+
     @property
     def aliases(self) -> typing.Sequence[str]:
         operation_aliases: typing.List[str] = list()
@@ -174,9 +221,7 @@ class CodeDesignation(BaseModel, types.HANDLER_FUNCTION):
     @property
     def loaded_function(self) -> types.HANDLER_FUNCTION:
         if self.__loaded_function is None:
-            function = types.get_code(self)
-            types.enforce_handler(function)
-            self.__loaded_function = function
+            self.__loaded_function = _load_handler(_CodeLocation(self.module_name, self.name))
 
         return self.__loaded_function
 
@@ -191,6 +236,11 @@ class CodeDesignation(BaseModel, types.HANDLER_FUNCTION):
 
         return value
 
+    @validator('kwargs', always=True)
+    def _freeze_kwargs(cls, value):
+        # The kwargs go into the cached description and hash, so they can't be allowed to change in place
+        return MappingProxyType(dict(value or {}))
+
     def set_function(self, handler_function: types.HANDLER_FUNCTION, *, already_checked: bool = None):
         if already_checked is None:
             already_checked = False
@@ -213,11 +263,36 @@ class CodeDesignation(BaseModel, types.HANDLER_FUNCTION):
 
         return self.loaded_function(connection, reader, message, **self.kwargs)
 
+    def __setattr__(self, name, value):
+        # Assignment isn't validated, so kwargs need to be frozen here as well
+        if name == "kwargs":
+            value = MappingProxyType(dict(value or {}))
+
+        super().__setattr__(name, value)
+
+        # The cached description and hash are built from fields, so they need to be rebuilt when a field changes
+        if name in self.__fields__:
+            self.__description = None
+            self.__hash_value = None
+
     def __hash__(self):
-        kwargs = json.dumps(self.kwargs) if self.kwargs else None
-        return hash((self.module_name, self.name, kwargs, self.message_type))
+        if self.__hash_value is None:
+            kwargs = json.dumps(dict(self.kwargs)) if self.kwargs else None
+            self.__hash_value = hash((self.module_name, self.name, kwargs, self.message_type))
+
+        return self.__hash_value
 
     def __str__(self):
+        if self.__description is None:
+            self.__description = self.__describe()
+
+        return self.__description
+
+    def __describe(self) -> str:
+        """
+        Returns:
+            A description of how this designation's handler will be called
+        """
         arguments = ["connection", "reader"]
 
         if self.message_type is None:
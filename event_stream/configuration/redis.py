@@ -11,6 +11,9 @@ from pydantic import Field
 from pydantic import validator
 
 from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool
+from redis.asyncio import ConnectionPool
+from redis.asyncio.connection import SSLConnection
 
 from event_stream.utilities.common import get_environment_variable
 from event_stream.configuration.parts import PasswordEnabled
@@ -18,6 +21,9 @@ from event_stream.configuration.ssl import SSLConfiguration
 
 from event_stream.system import settings
 
+_CONNECTION_POOLS: typing.Dict[typing.Tuple[typing.Tuple[str, typing.Any], ...], ConnectionPool] = dict()
+"""Connection pools shared between every client connecting to the same redis instance with the same settings"""
+
 
 class RedisConfiguration(BaseModel, PasswordEnabled):
     """
@@ -61,35 +67,60 @@ class RedisConfiguration(BaseModel, PasswordEnabled):
 
         return value
 
-    def connect(self) -> Redis:
-        additional_parameters = dict()
+    def get_connection_pool(self) -> ConnectionPool:
+        """
+        Get a connection pool for the described redis instance. Pools are shared between configurations that
+        connect the same way so that multiple readers may reuse the same sockets
+
+        Returns:
+            A connection pool for the redis instance
+        """
+        pool_parameters = {
+            "host": self.host,
+            "port": self.port,
+            "db": self.db,
+            "username": self.username,
+            "password": self.get_password(),
+            # Readers hold onto pooled connections for a long time, so keep idle sockets from being silently dropped
+            "socket_keepalive": True,
+            "retry_on_timeout": True,
+            # Wait for a connection to be returned to the pool rather than failing when every connection is in use
+            "max_connections": settings.redis_max_connections,
+        }
 
         if self.ssl_configuration is not None:
-            additional_parameters['ssl'] = True
+            pool_parameters['connection_class'] = SSLConnection
 
             if self.ssl_configuration.ca_file:
-                additional_parameters['ssl_certfile'] = self.ssl_configuration.ca_file
+                pool_parameters['ssl_certfile'] = self.ssl_configuration.ca_file
 
             if self.ssl_configuration.key_file:
-                additional_parameters['ssl_keyfile'] = self.ssl_configuration.key_file
+                pool_parameters['ssl_keyfile'] = self.ssl_configuration.key_file
 
             if self.ssl_configuration.ca_path:
-                additional_parameters['ssl_ca_path'] = self.ssl_configuration.ca_path
+                pool_parameters['ssl_ca_path'] = self.ssl_configuration.ca_path
 
             if self.ssl_configuration.password:
-                additional_parameters['ssl_password'] = self.ssl_configuration.get_password()
+                pool_parameters['ssl_password'] = self.ssl_configuration.get_password()
 
             if self.ssl_configuration.ca_certs:
-                additional_parameters['ssl_ca_certs'] = self.ssl_configuration.ca_certs
-
-        return Redis(
-            host=self.host,
-            port=self.port,
-            db=self.db,
-            username=self.username,
-            password=self.get_password(),
-            **additional_parameters
-        )
+                pool_parameters['ssl_ca_certs'] = self.ssl_configuration.ca_certs
+
+        pool_key = tuple(sorted(pool_parameters.items(), key=lambda parameter: parameter[0]))
+
+        if pool_key not in _CONNECTION_POOLS:
+            _CONNECTION_POOLS[pool_key] = BlockingConnectionPool(**pool_parameters)
+
+        return _CONNECTION_POOLS[pool_key]
+
+    def connect(self) -> Redis:
+        """
+        Create a client for the described redis instance that draws its connections from a shared pool
+
+        Returns:
+            A client connected to the redis instance
+        """
+        return Redis(connection_pool=self.get_connection_pool())
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
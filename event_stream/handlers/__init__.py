@@ -31,10 +31,12 @@ def get_master_functions(
         }
         candidates.update(module_candidates)
 
+    master_functions: typing.Dict[str, typing.Callable] = dict()
+
     for name, function in candidates.items():
         try:
-            enforce_handler(function)
+            master_functions[name] = enforce_handler(function)
         except:
-            candidates.pop(name)
+            pass
 
-    return candidates
\ No newline at end of file
+    return master_functions
@@ -1,7 +1,6 @@
 """
 Handlers for the master bus
 """
-import json
 import os
 import typing
 from pathlib import Path
@@ -14,12 +13,14 @@ from event_stream.messages import Message
 from event_stream.messages.master import PurgeMessage
 from event_stream.messages.master import TrimMessage
 from event_stream.utilities.common import decode_stream_message
+from event_stream.utilities.common import dump_json
 from event_stream.utilities.communication import transfer_messages_to_inbox
 from event_stream.messages.master import CloseMessage
 from event_stream.system import logging
 from streams.reader import EventStreamReader
 from utilities.types import event_handler
 
+
 DEFAULT_STREAM_RECORD_LOCATION = Path(os.environ.get("DEFAULT_EVENT_BUS_RECORD_DIRECTORY", "event_records"))
 DEFAULT_MAX_STREAM_LENGTH = int(os.environ.get("DEFAULT_MAX_STREAM_LENGTH", "500"))
 
@@ -40,33 +41,45 @@ async def trim_streams(connection: Redis, bus: EventStreamReader, message: TrimM
     """
     count = message.count or DEFAULT_MAX_STREAM_LENGTH
 
-    if message.save_output:
-        output_path: typing.Union[str, Path] = message.output_path or DEFAULT_STREAM_RECORD_LOCATION
+    if not message.save_output:
+        # Nothing needs to account for what was removed, so redis may trim whatever is cheapest
+        await connection.xtrim(bus.configuration.stream, maxlen=count, approximate=True)
+        return
+
+    output_path = Path(message.output_path or DEFAULT_STREAM_RECORD_LOCATION)
 
-        filename = message.filename
+    filename = message.filename
 
-        if not filename:
-            date_format = message.date_format or "%Y-%m-%d_%H%M"
+    if not filename:
+        date_format = message.date_format or "%Y-%m-%d_%H%M"
 
-            filename = f"{bus.configuration.stream}.{datetime.utcnow().strftime(date_format)}.txt"
+        filename = f"{bus.configuration.stream}.{datetime.utcnow().strftime(date_format)}.jsonl"
 
-        current_length = await connection.xlen(bus.configuration.stream)
+    output_path = output_path / filename
 
-        amount_to_write = current_length - count
+    current_length = await connection.xlen(bus.configuration.stream)
+    amount_to_write = current_length - count
 
-        if amount_to_write > 0:
-            data_to_write = await connection.xrange(bus.configuration.stream, count=amount_to_write)
-            data_to_write = {
-                key.decode(): decode_stream_message(value)
-                for key, value in data_to_write
-            }
+    if amount_to_write <= 0:
+        return
+
+    records = await connection.xrange(bus.configuration.stream, count=amount_to_write)
+
+    if not records:
+        return
 
-            output_path = output_path / filename
+    # Records are only removed from the stream once they are safely on disk
+    output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with output_path.open(mode='w') as log_file:
-                json.dump(data_to_write, log_file)
+    # Write one record per line so that the whole collection never has to be serialized at once. The file is appended
+    # to so that an earlier trim with the same filename (the default only changes once a minute) isn't overwritten
+    with output_path.open(mode='ab') as log_file:
+        for key, value in records:
+            record = {key.decode() if isinstance(key, bytes) else key: decode_stream_message(value)}
+            log_file.write(dump_json(record) + b"\n")
 
-    await connection.xtrim(bus.configuration.stream, maxlen=count, approximate=True)
+    # Delete exactly what was written - anything added while the file was being written stays in the stream
+    await connection.xdel(bus.configuration.stream, *[record_id for record_id, _ in records])
 
 
 async def purge_consumers(connection: Redis, bus: EventStreamReader, message: PurgeMessage, **kwargs):
@@ -98,7 +111,7 @@ async def purge_consumers(connection: Redis, bus: EventStreamReader, message: Pu
                 )
 
         current_groups = [
-            group['name'].decode()
+            group['name'].decode() if isinstance(group['name'], bytes) else group['name']
             for group in await connection.xinfo_groups(name=message.stream)
         ]
 
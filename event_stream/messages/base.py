@@ -4,14 +4,17 @@ Defines base classes for messages
 from __future__ import annotations
 
 import abc
-import json
 import inspect
+import linecache
+import operator
 import os
 import sys
+import types
 import typing
 import socket
 import typing_extensions
 
+from functools import lru_cache
 from functools import partial as prepare_function
 from pathlib import Path
 from datetime import datetime
@@ -31,23 +34,30 @@ from typing import (
 
 from pydantic import BaseModel
 from pydantic import Field
-from pydantic import FilePath
 from pydantic import Json
 from pydantic import PrivateAttr
+from pydantic.json import pydantic_encoder
 
 from redis.asyncio import Redis
 
+from event_stream.utilities.common import compress_fields
+from event_stream.utilities.common import dump_json
 from event_stream.utilities.common import get_by_path
 from event_stream.utilities.common import get_current_function_name
+from event_stream.utilities.common import walk_stack
 from event_stream.system.system import settings
 from event_stream.utilities.constants import BASE_DIRECTORY
 
-ACCEPTABLE_INPUT_TYPES: Final[Tuple[Type, ...]] = (
-    dict,
-    FilePath,
-    str,
-    bytes,
-)
+
+PARSE_METHODS: Final[Dict[Type, str]] = {
+    dict: "parse_obj",
+    Path: "parse_file",
+    str: "parse_raw",
+    bytes: "parse_raw",
+}
+"""The name of the pydantic parsing method to use for each type of acceptable input"""
+
+ACCEPTABLE_INPUT_TYPES: Final[Tuple[Type, ...]] = tuple(PARSE_METHODS)
 
 MODEL_TYPE = typing.TypeVar("MODEL_TYPE", bound=BaseModel, covariant=True)
 
@@ -57,6 +67,38 @@ EVENT_LITERAL_ADJUSTER = 100
 MAX_STACK_SIZE = 5
 
 
+CALLER_APPLICATION = os.path.basename(sys.argv[0]) if sys.argv else ""
+"""The name of the application that is running, as reported in message headers"""
+
+
+@lru_cache(maxsize=1)
+def get_host_info() -> typing.Tuple[str, str]:
+    """
+    Get the name and address of this host. The lookups may require DNS resolution, so they are only performed once
+    since the host won't change over the life of the process
+
+    Returns:
+        The fully qualified domain name and the IP address of this host
+    """
+    hostname = socket.gethostname()
+    return socket.getfqdn(hostname), socket.gethostbyname(hostname)
+
+
+@lru_cache(maxsize=None)
+def get_signature(obj: typing.Callable) -> inspect.Signature:
+    """
+    Get the signature of a class or function. Signatures are cached since they are expensive to build and
+    never change for the same object
+
+    Args:
+        obj: The class or function to inspect
+
+    Returns:
+        The signature of the given object
+    """
+    return inspect.signature(obj)
+
+
 def extra_calculation(calculation: WEIGHT_FUNCTION) -> WEIGHT_FUNCTION:
     """
     A decorator that attaches the 'is_weight_calculation'=True attribute on a function
@@ -66,7 +108,7 @@ def extra_calculation(calculation: WEIGHT_FUNCTION) -> WEIGHT_FUNCTION:
     Returns:
 
     """
-    if not isinstance(calculation, typing.Callable):
+    if not callable(calculation):
         raise ValueError(
             f"An object must be callable to be considered as an extra calculations"
         )
@@ -100,23 +142,26 @@ class ParseableModel(abc.ABC, BaseModel):
         if allow_pickle is None:
             allow_pickle = False
 
-        if not isinstance(data, ACCEPTABLE_INPUT_TYPES):
+        parse_method = PARSE_METHODS.get(type(data))
+
+        # Subclasses, like the concrete types of `Path`, won't be found by their exact type
+        if parse_method is None:
+            parse_method = next(
+                (method for input_type, method in PARSE_METHODS.items() if isinstance(data, input_type)),
+                None
+            )
+
+        if parse_method is None:
             raise TypeError(
                 f"'{type(data)}' is not a supported input format for EventStream Messages. "
                 f"Acceptable formats are: "
                 f"{', '.join([str(acceptable_type) for acceptable_type in ACCEPTABLE_INPUT_TYPES])}"
             )
 
-        if isinstance(data, FilePath):
-            model = cls.parse_file(data, content_type=content_type, allow_pickle=allow_pickle)
-        elif isinstance(data, dict):
-            model = cls.parse_obj(data)
-        elif isinstance(data, (str, bytes)):
-            model = cls.parse_raw(data, content_type=content_type, allow_pickle=allow_pickle)
-        else:
-            raise NotImplementedError(f"The parsing logic for '{type(data)}' data has not yet been implemented")
+        if parse_method == "parse_obj":
+            return cls.parse_obj(data)
 
-        return model
+        return getattr(cls, parse_method)(data, content_type=content_type, allow_pickle=allow_pickle)
 
 
 class WeightedModel(ParseableModel, abc.ABC):
@@ -143,7 +188,7 @@ class WeightedModel(ParseableModel, abc.ABC):
         if getattr(obj, "__self__", None) is not cls or not inspect.ismethod(obj):
             return False
 
-        signature = inspect.signature(obj)
+        signature = get_signature(obj)
 
         # The return type is only compatible if it isn't defined or if it can be considered as an integer,
         #   otherwise this function needs to return False
@@ -187,7 +232,7 @@ class WeightedModel(ParseableModel, abc.ABC):
         if not is_function or object_name != qualified_name:
             return False
 
-        signature = inspect.signature(obj)
+        signature = get_signature(obj)
 
         # Weight functions will be called with a single positional parameter,
         #   so try to grab a list of all parameters that don't require a keyword
@@ -262,16 +307,16 @@ class WeightedModel(ParseableModel, abc.ABC):
         Returns:
             The weight of this model describing its specificity
         """
-        if cls._weight is None:
-            required_fields = {
-                key: field
-                for key, field in cls.__fields__.items()
-                if field.required
-            }
+        # Look in this class' own namespace - reading `cls._weight` would hand back a weight cached by a parent
+        weight = cls.__dict__.get("_weight")
+
+        if weight is None:
+            weight = len(cls.__mro__)
 
-            weight = len(inspect.getmro(cls))
+            for field in cls.__fields__.values():
+                if not field.required:
+                    continue
 
-            for key, field in required_fields.items():
                 if isinstance(field.type_, WeightedModel):
                     weight += field.type_.get_weight()
                 else:
@@ -279,9 +324,10 @@ class WeightedModel(ParseableModel, abc.ABC):
 
             weight += cls.__perform_extra_weight_calculations()
 
-            cls._weight = round(weight)
+            weight = round(weight)
+            cls._weight = weight
 
-        return cls._weight
+        return weight
 
     @classmethod
     def _get_extra_weight_calculations(cls) -> typing.Sequence[typing.Callable[[], typing.SupportsInt]]:
@@ -329,12 +375,26 @@ class WeightedModel(ParseableModel, abc.ABC):
                 )
 
         # Now check for all decorated functions within this class to find other weight calculations
-        members = inspect.getmembers(
-            cls,
-            predicate=lambda member: hasattr(member, "is_weight_calculation") and inspect.isfunction(member)
-        )
+        # Only class namespaces are walked - `inspect.getmembers` would resolve every attribute of the model
+        members: typing.Dict[str, typing.Callable] = dict()
+
+        for klass in cls.__mro__:
+            for name, member in vars(klass).items():
+                if name in members:
+                    continue
+
+                if isinstance(member, staticmethod):
+                    member = member.__func__
 
-        for name, function in members:
+                members[name] = member
+
+        members = {
+            name: member
+            for name, member in members.items()
+            if hasattr(member, "is_weight_calculation") and inspect.isfunction(member)
+        }
+
+        for name, function in sorted(members.items()):
             # If the found weight calculation complies with weight function constraints, we can go ahead and add it
             if cls.__could_be_internal_weight_function(function):
                 found_calculations.append(function)
@@ -366,7 +426,7 @@ class StackInfo(BaseModel):
     Describes stack information for where the current line and its path lies in the codebase
     """
     @classmethod
-    def create(cls, frame: inspect.FrameInfo):
+    def create(cls, frame: types.FrameType):
         """
         Create the information object based on the python object that provides all of the data
 
@@ -378,11 +438,11 @@ class StackInfo(BaseModel):
         """
         # There's a potential risk if the entire path is given in a stack trace, so we want to limit how much is seen
         if isinstance(BASE_DIRECTORY, Path):
-            base_directory = str(settings.base_directory.resolve())
+            base_directory = str(BASE_DIRECTORY.resolve())
         else:
             base_directory = str(Path(BASE_DIRECTORY).resolve())
 
-        filepath = str(Path(frame.filename).resolve())
+        filepath = str(Path(frame.f_code.co_filename).resolve())
 
         # If the path of the current file is underneath that of the base directory, we're safe to display
         # everything AFTER it since it won't show any system details, only those of the app
@@ -402,9 +462,9 @@ class StackInfo(BaseModel):
                 filename = filepath_parts[-1]
 
         return cls(
-            line_number=frame.lineno,
-            function=frame.function,
-            code=frame.code_context[0].strip(),
+            line_number=frame.f_lineno,
+            function=frame.f_code.co_name,
+            code=linecache.getline(frame.f_code.co_filename, frame.f_lineno).strip(),
             file=filename
         )
 
@@ -416,12 +476,12 @@ class StackInfo(BaseModel):
         """
         full_stack = list()
 
-        # Walk through the entire stack trace minus the two entries - those will just show the creation of this stack
-        # trace and nothing of real interest
-        for index, frame in enumerate(inspect.stack()[2:]):
+        # Walk outward through the stack minus the two innermost entries - those will just show the creation of this
+        # stack trace and nothing of real interest
+        for index, frame in enumerate(walk_stack(2)):
             # If the name of the function is `<module>`, it means this function was called as part of an import
             # and stack traces can be quite long, so limit the length by exiting the loop if we've gone too deep
-            if frame.function.strip() == "<module>" or index >= MAX_STACK_SIZE:
+            if frame.f_code.co_name.strip() == "<module>" or index >= MAX_STACK_SIZE:
                 break
 
             # Insert the entry rather than appending it in order to maintain a list of entries in chronological order.
@@ -463,12 +523,15 @@ class HeaderInfo(BaseModel):
         if include_stack is None:
             include_stack = settings.debug
 
+        caller, host = get_host_info()
+
         args = {
-            "caller_application": os.path.basename(sys.argv[0]),
+            "caller_application": CALLER_APPLICATION,
             "caller_function": get_current_function_name(parent_name=True),
-            "caller": socket.getfqdn(socket.gethostname()),
-            "date": datetime.now().astimezone().strftime(settings.datetime_format),
-            "host": socket.gethostbyname(socket.gethostname())
+            "caller": caller,
+            # The field is a datetime, so hand over the value itself rather than a string pydantic would have to parse
+            "date": datetime.now().astimezone().replace(microsecond=0),
+            "host": host
         }
 
         if include_stack:
@@ -516,13 +579,38 @@ class Message(WeightedModel, Mapping):
     __extra_data: dict = PrivateAttr(default_factory=dict)
     """A container for extra data that was transmitted but not explicitly defined on the model"""
 
+    _field_names: ClassVar[typing.Tuple[str, ...]] = tuple()
+    """The names of every field on this class, in order"""
+
+    _field_name_set: ClassVar[typing.FrozenSet[str]] = frozenset()
+    """The names of every field on this class, for quick membership checks"""
+
+    _field_getters: ClassVar[typing.Dict[str, typing.Callable[[Message], typing.Any]]] = dict()
+    """Functions that read each field from an instance of this class, keyed by field name"""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._cache_field_names()
+
+    @classmethod
+    def _cache_field_names(cls):
+        """
+        Record the names of this class' fields so that mapping operations don't need to rebuild them
+        """
+        cls._field_names = tuple(cls.__fields__)
+        cls._field_name_set = frozenset(cls._field_names)
+        cls._field_getters = {
+            field_name: operator.attrgetter(field_name)
+            for field_name in cls._field_names
+        }
+
     @classmethod
     @extra_calculation
     def _adjust_weight_for_literal_event(cls) -> typing.SupportsInt:
         """
         Increase the weight of this class if its event is a literal
         """
-        signature = inspect.signature(cls)
+        signature = get_signature(cls)
         class_parameters = signature.parameters
         event_parameter_annotation = class_parameters['event'].annotation
 
@@ -633,25 +721,26 @@ class Message(WeightedModel, Mapping):
         # Try to find the value within its internal set of extra data
         return get_by_path(self.__extra_data, *keys, default)
 
-    async def send(
+    def get_stream_fields(
         self,
-        connection: Redis,
         stream_name: str,
         include_header: bool = None,
         application_name: str = None,
         application_instance: str = None,
         **kwargs
-    ):
+    ) -> typing.Dict[str, typing.Any]:
         """
-        Send this message through the given redis connection
+        Flatten this message into the fields that will be written to a stream
 
         Args:
-            connection: The connection to send the message through
-            stream_name: The stream to publish this data to
+            stream_name: The stream that the message will be published to
             include_header: Whether to include header information along with the message
             application_name: The name of the application. Required if not already on the message
             application_instance: The instance of the application. Required if not already on the message
             **kwargs:
+
+        Returns:
+            The key value pairs to send through the stream
         """
         # An application identifier is required. Raise an error if one or both can't be found.
         application_identifier_errors: typing.List[str] = list()
@@ -682,20 +771,23 @@ class Message(WeightedModel, Mapping):
         key_value_pairs = self.__extra_data.copy()
 
         # Climb through all fields and attach its data in a format that can be sent through the stream
-        for field_name in self.__fields__.keys():  # type: str
+        for field_name in self._field_names:  # type: str
             field_value = getattr(self, field_name)
 
             # 'None' can't go through the stream since it gives incorrect values later, so just don't send it here
             if field_value is None:
                 continue
-            elif hasattr(field_value, "json") and inspect.isfunction(field_value.json):
+            elif isinstance(field_value, BaseModel):
                 # Convert the data to json if it can be - that's the only way to ensure that it can be
-                # parsed correctly later
-                key_value_pairs[field_name] = field_value.json()
+                # parsed correctly later. Models with their own encoders need pydantic to apply them
+                if field_value.__config__.json_encoders:
+                    key_value_pairs[field_name] = field_value.json()
+                else:
+                    key_value_pairs[field_name] = dump_json(field_value.dict(), default=pydantic_encoder)
             elif not isinstance(field_value, (str, bytes, int, float)):
                 # If it isn't a natural Redis data type, try to convert it into a form that will be accepted
                 try:
-                    key_value_pairs[field_name] = json.dumps(field_value)
+                    key_value_pairs[field_name] = dump_json(field_value, default=pydantic_encoder)
                 except:
                     # Otherwise try to convert it into bytes (Redis' native type) so that it may be sent across the wire
                     key_value_pairs[field_name] = bytes(field_value)
@@ -708,8 +800,78 @@ class Message(WeightedModel, Mapping):
             else:
                 key_value_pairs[field_name] = field_value
 
+        # Large payloads are compressed to spare memory and bandwidth on the redis instance
+        if settings.compression_threshold:
+            key_value_pairs = compress_fields(key_value_pairs, settings.compression_threshold)
+
+        return key_value_pairs
+
+    async def send(
+        self,
+        connection: Redis,
+        stream_name: str,
+        include_header: bool = None,
+        application_name: str = None,
+        application_instance: str = None,
+        **kwargs
+    ):
+        """
+        Send this message through the given redis connection
+
+        Args:
+            connection: The connection to send the message through
+            stream_name: The stream to publish this data to
+            include_header: Whether to include header information along with the message
+            application_name: The name of the application. Required if not already on the message
+            application_instance: The instance of the application. Required if not already on the message
+            **kwargs:
+        """
+        key_value_pairs = self.get_stream_fields(
+            stream_name=stream_name,
+            include_header=include_header,
+            application_name=application_name,
+            application_instance=application_instance,
+            **kwargs
+        )
         await connection.xadd(stream_name, fields=key_value_pairs, maxlen=settings.approximate_max_stream_length)
 
+    @classmethod
+    async def send_many(
+        cls,
+        connection: Redis,
+        stream_name: str,
+        messages: typing.Iterable[Message],
+        include_header: bool = None,
+        application_name: str = None,
+        application_instance: str = None,
+        **kwargs
+    ):
+        """
+        Send several messages through the given redis connection in a single round trip
+
+        Args:
+            connection: The connection to send the messages through
+            stream_name: The stream to publish the messages to
+            messages: The messages to send
+            include_header: Whether to include header information along with each message
+            application_name: The name of the application. Required if not already on each message
+            application_instance: The instance of the application. Required if not already on each message
+            **kwargs:
+        """
+        pipeline = connection.pipeline(transaction=False)
+
+        for message in messages:
+            key_value_pairs = message.get_stream_fields(
+                stream_name=stream_name,
+                include_header=include_header,
+                application_name=application_name,
+                application_instance=application_instance,
+                **kwargs
+            )
+            pipeline.xadd(stream_name, fields=key_value_pairs, maxlen=settings.approximate_max_stream_length)
+
+        await pipeline.execute()
+
     def dict(
         self,
         *,
@@ -744,22 +906,15 @@ class Message(WeightedModel, Mapping):
             exclude_none=exclude_none
         )
 
-        # Add everything not already in the dictionary from the extra data to the dictionary that will be returned
-        for key, value in self.get_data():
-            if key not in dictionary_representation:
-                dictionary_representation[key] = value
-
-        return dictionary_representation
+        # Merge the extra data in a single pass - anything already in the dictionary takes precedence
+        return {**self.__extra_data, **dictionary_representation}
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
         # Add all keyword arguments that aren't fields as extra data
-        for key, value in kwargs.items():
-            if key in self.__fields__:
-                continue
-
-            self.__extra_data[key] = value
+        field_names = self._field_name_set
+        self.__extra_data = {key: value for key, value in kwargs.items() if key not in field_names}
 
     def __getitem__(self, key: Union[int, str]):
         """
@@ -777,8 +932,11 @@ class Message(WeightedModel, Mapping):
         if isinstance(key, int):
             return list(self.values())[key]
 
-        if key in self.__fields__:
-            return getattr(self, key)
+        getter = self._field_getters.get(key)
+
+        if getter is not None:
+            return getter(self)
+
         # Try to get the value from the extra data if it wasn't in the fields
         return self.__extra_data[key]
 
@@ -791,7 +949,7 @@ class Message(WeightedModel, Mapping):
             value: The new value
         """
         # Set the value normally if it's a field
-        if key in self.__fields__:
+        if key in self._field_name_set:
             setattr(self, key, value)
         elif key not in self.__extra_data:
             # Only existing values may be altered, so if it's not a field and wasn't in extra data when the
@@ -805,21 +963,16 @@ class Message(WeightedModel, Mapping):
         Returns:
             The length of the extra data
         """
-        return len(self.__extra_data) + len(self.__fields__)
+        return len(self.__extra_data) + len(self._field_names)
 
     def keys(self) -> typing.Sequence[str]:
         """
         Returns:
             The keys for all extra data and fields
         """
-        data = [
-            key
-            for key in self.__extra_data.keys()
-            if key not in self.__fields__
-        ]
-
-        data.extend(self.__fields__.keys())
-
+        field_names = self._field_name_set
+        data = [key for key in self.__extra_data if key not in field_names]
+        data.extend(self._field_names)
         return data
 
     def values(self) -> typing.Sequence[typing.Any]:
@@ -827,15 +980,9 @@ class Message(WeightedModel, Mapping):
         Returns:
             All values from the extra data and fields
         """
-        data = [
-            value
-            for key, value in self.__extra_data.items()
-            if key not in self.__fields__
-        ]
-
-        for field_name in self.__fields__:
-            data.append(getattr(self, field_name))
-
+        field_names = self._field_name_set
+        data = [value for key, value in self.__extra_data.items() if key not in field_names]
+        data.extend(getattr(self, field_name) for field_name in self._field_names)
         return data
 
     def items(self) -> typing.Sequence[typing.Tuple[str, typing.Any]]:
@@ -844,21 +991,23 @@ class Message(WeightedModel, Mapping):
             A sequence of 2-tuples stored within the instance, with the first value being a key and the second
             being a value
         """
+        field_names = self._field_name_set
         data: typing.List[typing.Tuple[str, typing.Any]] = [
             (key, value)
             for key, value in self.__extra_data.items()
-            if key not in self.__fields__
+            if key not in field_names
         ]
-
-        for field_name in self.__fields__:
-            data.append((field_name, getattr(self, field_name)))
-
+        data.extend((field_name, getattr(self, field_name)) for field_name in self._field_names)
         return data
 
     def __iter__(self):
         return iter(self.items())
 
 
+# Subclasses record their field names as they are defined, but Message has to be told to do so itself
+Message._cache_field_names()
+
+
 class GenericMessage(Message):
     """
     A very basic message type that just takes an unstructured dictionary as its 'data' payload
@@ -2,6 +2,7 @@
 Defines a bus object that polls for messages and distributes them to appropriate registered event handlers
 """
 import typing
+import asyncio
 
 from event_stream.configuration.bus import EventBusConfiguration
 from event_stream.streams.reader import EventStreamReader
@@ -10,6 +11,7 @@ from event_stream.utilities.communication import GroupConsumer
 from event_stream.system import logging
 
 from event_stream.utilities.common import fulfill_method
+from event_stream.utilities.types import is_hashable
 
 
 class EventBus(EventStreamReader):
@@ -42,31 +44,22 @@ class EventBus(EventStreamReader):
         results: typing.List[typing.Hashable] = list()
 
         if event_name:
-            event_handled = False
-            event_defined = event_name in self.configuration.handlers
-
-            for handler in self.configuration.get_handlers(event_name):
-                event_handled = True
-                result = None
-                result_created = False
-
-                try:
-                    result = await fulfill_method(handler, consumer.connection, self, **payload)
-                    result_created = True
-                    if isinstance(result, typing.Hashable):
-                        results.append(result)
-                except BaseException as exception:
-                    logging.error(str(exception), exception=exception)
-
-                if result_created:
-                    try:
-                        await self.process_response(
-                            consumer=consumer,
-                            message_id=message_id,
-                            result=result
-                        )
-                    except BaseException as exception:
-                        logging.error(str(exception), exc_info=exception)
+            # A single lookup tells whether the event is defined and which handlers to call
+            handlers = self.configuration.handlers.get(event_name)
+            event_defined = handlers is not None
+
+            # Handlers spend most of their time waiting on I/O, so they are all run at once
+            handler_results = await asyncio.gather(
+                *[
+                    self._run_handler(consumer=consumer, handler=handler, message_id=message_id, payload=payload)
+                    for handler in handlers or ()
+                ]
+            )
+            event_handled = len(handler_results) > 0
+
+            for result_created, result in handler_results:
+                if result_created and is_hashable(result):
+                    results.append(result)
 
             if event_defined and not event_handled:
                 logging.warning(
@@ -81,6 +74,46 @@ class EventBus(EventStreamReader):
 
         return results
 
+    async def _run_handler(
+        self,
+        consumer: GroupConsumer,
+        handler: typing.Callable,
+        message_id: str,
+        payload: typing.Dict[str, typing.Any]
+    ) -> typing.Tuple[bool, typing.Any]:
+        """
+        Call a single handler for a message and send out whatever response it creates
+
+        Args:
+            consumer: The consumer controlling the communication with the redis instance
+            handler: The handler to call
+            message_id: The ID of the received message
+            payload: The data that came with the message
+
+        Returns:
+            Whether the handler created a result and the result itself
+        """
+        try:
+            result = await fulfill_method(handler, consumer.connection, self, **payload)
+        except BaseException as exception:
+            logging.error(str(exception), exception=exception)
+            return False, None
+
+        # Handlers that don't return anything have nothing to respond with, so don't bother scheduling a response
+        if result is None:
+            return True, result
+
+        try:
+            await self.process_response(
+                consumer=consumer,
+                message_id=message_id,
+                result=result
+            )
+        except BaseException as exception:
+            logging.error(str(exception), exc_info=exception)
+
+        return True, result
+
     def __str__(self):
         return str(self.configuration)
 
@@ -14,6 +14,7 @@ from event_stream.utilities.common import fulfill_method
 from event_stream.utilities.communication import GroupConsumer
 
 from event_stream.system import logging
+from event_stream.system import settings
 
 
 class HandlerReader(EventStreamReader):
@@ -41,7 +42,13 @@ class HandlerReader(EventStreamReader):
             processed = True
 
         if processed:
-            await consumer.mark_message_processed(message_id)
+            await consumer.acknowledge(message_id)
+        elif await consumer.record_failure(message_id, self.configuration.handler.identifier):
+            logging.error(
+                f"Message '{message_id}' could not be processed after {settings.max_handler_attempts} attempts - "
+                f"it will no longer be retried"
+            )
+            await consumer.acknowledge(message_id)
         else:
             logging.warning(f"Message '{message_id}' could not be processed - returning it to the queue for processing")
             await consumer.give_up_message(message_id)
@@ -83,7 +90,8 @@ def create_master_handlers(
         configuration: HandlerGroup = HandlerGroup.parse_obj(master_handler_definition)
         configuration.set_application_name(application_name)
         configuration.set_instance_identifier(application_instance)
-        configuration.handler.set_function(function)
+        # `get_master_functions` only returns functions that have already been checked
+        configuration.handler.set_function(function, already_checked=True)
         handler = MasterHandlerReader(configuration=configuration, verbose=verbose)
         handlers.append(handler)
 
@@ -8,6 +8,7 @@ import abc
 from redis.asyncio import Redis
 
 import event_stream.system.logging as logging
+from event_stream.system import settings
 from event_stream.configuration.communication import ListenerConfiguration
 from event_stream.messages import Message
 from event_stream.utilities.common import decode_stream_message
@@ -37,8 +38,8 @@ class EventStreamReader(abc.ABC, typing.Generic[LISTENER_CONFIGURATION]):
         self._configuration: LISTENER_CONFIGURATION = configuration
         """The configuration responsible for defining how this reader should behave"""
 
-        self.__keep_polling = True
-        """Indicator that the loop should keep running if it already is"""
+        self.__stop_event = asyncio.Event()
+        """Signal that the loop should stop running if it already is"""
 
         self.__current_operation: typing.Optional[asyncio.Task] = None
         """An asynchronous reading task created via the launch command"""
@@ -78,7 +79,7 @@ class EventStreamReader(abc.ABC, typing.Generic[LISTENER_CONFIGURATION]):
         """
         Stop the reader from continuing to poll the redis stream
         """
-        self.__keep_polling = False
+        self.__stop_event.set()
 
     def launch(self) -> asyncio.Task:
         """
@@ -100,7 +101,7 @@ class EventStreamReader(abc.ABC, typing.Generic[LISTENER_CONFIGURATION]):
         still_running = still_running and not self.__current_operation.done()
         still_running = still_running and not self.__current_operation.cancelled()
 
-        self.__keep_polling = False
+        self.__stop_event.set()
 
         if still_running:
             try:
@@ -148,6 +149,57 @@ class EventStreamReader(abc.ABC, typing.Generic[LISTENER_CONFIGURATION]):
         """
         ...
 
+    async def process_messages(
+        self,
+        consumer: GroupConsumer,
+        messages: typing.Mapping[str, typing.Dict[str, typing.Any]]
+    ) -> typing.Dict[str, typing.Optional[typing.Union[typing.Sequence, Message, BaseException]]]:
+        """
+        Interpret a batch of incoming messages concurrently
+
+        Args:
+            consumer: The consumer providing the redis connection and communication details
+            messages: A mapping of message IDs to the data that arrived with them
+
+        Returns:
+            The results of processing each message, mapped to the ID of its message. Errors that occurred while
+            processing a message are returned rather than raised
+        """
+        message_ids = list(messages.keys())
+        results = await asyncio.gather(
+            *[
+                self.process_message(consumer, message_id, decode_stream_message(messages[message_id]))
+                for message_id in message_ids
+            ],
+            return_exceptions=True
+        )
+        return dict(zip(message_ids, results))
+
+    async def read_until_stopped(self, consumer: GroupConsumer) -> typing.Optional[typing.Mapping[str, typing.Dict]]:
+        """
+        Read from the stream, abandoning the read as soon as the reader is told to stop polling
+
+        Args:
+            consumer: The consumer to read with
+
+        Returns:
+            The messages that were read, or None if the reader was stopped first
+        """
+        read_task = asyncio.create_task(consumer.read(count=settings.read_batch_size))
+        stop_task = asyncio.create_task(self.__stop_event.wait())
+
+        try:
+            await asyncio.wait((read_task, stop_task), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # Messages claimed by an abandoned read stay pending for the consumer and are moved to the inbox on exit
+            read_task.cancel()
+            stop_task.cancel()
+
+        if self.__stop_event.is_set():
+            return None
+
+        return read_task.result()
+
     async def listen(self):
         """
         Poll the redis stream and bring back relevant messages
@@ -156,7 +208,7 @@ class EventStreamReader(abc.ABC, typing.Generic[LISTENER_CONFIGURATION]):
             self._configuration.redis_configuration
         )
 
-        self.__keep_polling = True
+        self.__stop_event.clear()
 
         async with connection:
             consumer = GroupConsumer(
@@ -169,62 +221,7 @@ class EventStreamReader(abc.ABC, typing.Generic[LISTENER_CONFIGURATION]):
                 if self.verbose:
                     logging.info(f"Now listening to {consumer.group_name}...")
 
-                while self.__keep_polling:
-                    messages = await consumer.read()
-
-                    if messages is None:
-                        logging.error(f"Something went wrong when reading from the stream - waiting and trying again")
-                        await asyncio.sleep(1)
-                        continue
-
-                    message_processes: typing.Dict[str, typing.Coroutine] = {
-                        message_id: self.process_message(consumer, message_id, decode_stream_message(payload))
-                        for message_id, payload in messages.items()
-                    }
-
-                    response_processes: typing.List[typing.Coroutine] = list()
-
-                    for message_id, process in message_processes.items():
-                        try:
-                            responses = await process
-                            if responses is None or isinstance(responses, typing.Sequence) and len(responses) == 0:
-                                continue
-
-                            if isinstance(responses, BaseException):
-                                logging.error(
-                                    f"A process for message '{message_id}' in Event Stream "
-                                    f"'{self.configuration.get_application_name()}:"
-                                    f"{self.configuration.get_instance_identifier()}' failed",
-                                    responses
-                                )
-                            elif isinstance(responses, Message):
-                                response_processes.append(
-                                    self.process_response(consumer=consumer, message_id=message_id, result=responses)
-                                )
-                            else:
-                                response_processes.extend([
-                                    self.process_response(consumer=consumer, message_id=message_id, result=response)
-                                    for response in responses
-                                ])
-                        except BaseException as exception:
-                            logging.error(
-                                f"Processing for message '{message_id}' in Event Stream "
-                                f"'{self.configuration.get_application_name()}:"
-                                f"{self.configuration.get_instance_identifier()}' failed",
-                                exception
-                            )
-
-                    response_results = await asyncio.gather(*response_processes)
-
-                    on_each(
-                        func=lambda error: logging.error(
-                            f"An errored occurred when processing a message response in "
-                            f"'{self.configuration.get_application_name()}:"
-                            f"{self.configuration.get_instance_identifier()}'"
-                        ),
-                        values=response_results,
-                        predicate=lambda result: isinstance(result, BaseException)
-                    )
+                await self.__poll(consumer)
 
                 if self.__verbose:
                     logging.info(
@@ -232,6 +229,79 @@ class EventStreamReader(abc.ABC, typing.Generic[LISTENER_CONFIGURATION]):
                         f"'{self.configuration.get_application_name()} is no longer listening for messages"
                     )
 
+    async def __poll(self, consumer: GroupConsumer):
+        """
+        Process batches of messages until told to stop
+
+        Args:
+            consumer: The consumer to read with
+        """
+        while not self.__stop_event.is_set():
+            # Read in bounded batches so that a backed up stream can't flood the reader all at once
+            messages = await self.read_until_stopped(consumer)
+
+            if messages is None:
+                break
+
+            await self.process_batch(consumer, messages)
+
+            # Messages that other consumers still need are only moved to the inbox once acknowledgements are flushed.
+            # The next read only starts afterwards so that it sees everything this batch sent back to the inbox
+            await consumer.flush_acknowledgements()
+
+    async def process_batch(self, consumer: GroupConsumer, messages: typing.Mapping[str, typing.Dict[str, typing.Any]]):
+        """
+        Process a batch of messages and send out every response that they created
+
+        Args:
+            consumer: The consumer providing the redis connection and communication details
+            messages: A mapping of message IDs to the data that arrived with them
+        """
+        message_results = await self.process_messages(consumer, messages)
+
+        response_processes: typing.List[typing.Coroutine] = list()
+
+        for message_id, responses in message_results.items():
+            try:
+                if responses is None or isinstance(responses, typing.Sequence) and len(responses) == 0:
+                    continue
+
+                if isinstance(responses, BaseException):
+                    logging.error(
+                        f"A process for message '{message_id}' in Event Stream "
+                        f"'{self.configuration.get_application_name()}:"
+                        f"{self.configuration.get_instance_identifier()}' failed",
+                        responses
+                    )
+                elif isinstance(responses, Message):
+                    response_processes.append(
+                        self.process_response(consumer=consumer, message_id=message_id, result=responses)
+                    )
+                else:
+                    response_processes.extend([
+                        self.process_response(consumer=consumer, message_id=message_id, result=response)
+                        for response in responses
+                    ])
+            except BaseException as exception:
+                logging.error(
+                    f"Processing for message '{message_id}' in Event Stream "
+                    f"'{self.configuration.get_application_name()}:"
+                    f"{self.configuration.get_instance_identifier()}' failed",
+                    exception
+                )
+
+        response_results = await asyncio.gather(*response_processes)
+
+        on_each(
+            func=lambda error: logging.error(
+                f"An errored occurred when processing a message response in "
+                f"'{self.configuration.get_application_name()}:"
+                f"{self.configuration.get_instance_identifier()}'"
+            ),
+            values=response_results,
+            predicate=lambda result: isinstance(result, BaseException)
+        )
+
 
 class CloseableEventStreamReader(ListenerConfiguration, abc.ABC):
     @property
@@ -1,6 +1,7 @@
 """
 @TODO: Put a module wide description here
 """
+import json
 import typing
 import os
 
@@ -23,6 +24,7 @@ DEFAULT_REDIS_PORT = int(os.environ.get("EVENT_BUS_REDIS_PORT", 6379))
 DEFAULT_REDIS_USER = os.environ.get("EVENT_BUS_REDIS_USER", None)
 DEFAULT_REDIS_PASSWORD = os.environ.get("EVENT_BUS_REDIS_PASSWORD", None)
 DEFAULT_REDIS_DB = int(os.environ.get("EVENT_BUS_REDIS_DB", 0))
+DEFAULT_REDIS_MAX_CONNECTIONS = int(os.environ.get("EVENT_BUS_REDIS_MAX_CONNECTIONS", 100))
 DEFAULT_INBOX_CONSUMER_NAME = os.environ.get("EVENT_BUS_SENTINEL_CONSUMER_NAME", "inbox")
 DEFAULT_MASTER_STREAM = os.environ.get("EVENT_BUS_MASTER_STREAM", "MASTER")
 DEFAULT_MAX_LENGTH = int(float(os.environ.get("EVENT_BUS_MAX_LENGTH", 100)))
@@ -31,21 +33,37 @@ LOG_DIRECTORY = Path(os.environ.get("EVENT_BUS_LOG_DIRECTORY", "../"))
 KEY_SEPARATOR = os.environ.get("EVENT_BUS_KEY_SEPARATOR", ":")
 KEY_LIFETIME_SECONDS = timedelta(seconds=int(os.environ.get("EVENT_BUS_LIFETIME_SECONDS", 60 * 60 * 2)))
 DEBUG = os.environ.get("DEBUG_EVENT_BUS", "True").lower() in TRUE_VALUES
+VALIDATE_HANDLERS = os.environ.get("EVENT_BUS_VALIDATE_HANDLERS", "True").lower() in TRUE_VALUES
 
 MAX_IDLE_TIME_MS = int(os.environ.get("EVENT_BUS_IDLE_TIME_MS", 1000 * 60 * 10))
+READ_BATCH_SIZE = int(os.environ.get("EVENT_BUS_READ_BATCH_SIZE", 100))
+MAX_HANDLER_ATTEMPTS = int(os.environ.get("EVENT_BUS_MAX_HANDLER_ATTEMPTS", 5))
+ACKNOWLEDGEMENT_BATCH_SIZE = int(os.environ.get("EVENT_BUS_ACKNOWLEDGEMENT_BATCH_SIZE", 50))
+ACKNOWLEDGEMENT_DELAY_MS = int(os.environ.get("EVENT_BUS_ACKNOWLEDGEMENT_DELAY_MS", 100))
+COMPRESSION_THRESHOLD = int(os.environ.get("EVENT_BUS_COMPRESSION_THRESHOLD", 0))
 
 
 class _SystemSettings(BaseModel):
+    class Config:
+        # `event_stream.utilities.common` depends on these settings, so its `load_json` can't be used here
+        json_loads = json.loads
+
     application_name: typing.Optional[str] = Field(default=DEFAULT_APPLICATION_NAME)
     key_prefix: typing.Optional[str] = Field(default=None)
     key_lifetime_seconds: typing.Optional[timedelta] = Field(default=KEY_LIFETIME_SECONDS)
     key_separator: typing.Optional[str] = Field(default=KEY_SEPARATOR)
     datetime_format: typing.Optional[str] = Field(default=DEFAULT_DATETIME_FORMAT)
     debug: typing.Optional[bool] = Field(default=DEBUG)
+    validate_handlers: typing.Optional[bool] = Field(default=VALIDATE_HANDLERS)
     log_directory: typing.Optional[typing.Union[str, Path]] = Field(default=LOG_DIRECTORY)
     consumer_inbox_name: typing.Optional[str] = Field(default=DEFAULT_INBOX_CONSUMER_NAME)
     master_stream: typing.Optional[str] = Field(default=DEFAULT_MASTER_STREAM)
     max_idle_time: typing.Optional[int] = Field(default=MAX_IDLE_TIME_MS)
+    read_batch_size: typing.Optional[int] = Field(default=READ_BATCH_SIZE)
+    max_handler_attempts: typing.Optional[int] = Field(default=MAX_HANDLER_ATTEMPTS)
+    acknowledgement_batch_size: typing.Optional[int] = Field(default=ACKNOWLEDGEMENT_BATCH_SIZE)
+    acknowledgement_delay_ms: typing.Optional[int] = Field(default=ACKNOWLEDGEMENT_DELAY_MS)
+    compression_threshold: typing.Optional[int] = Field(default=COMPRESSION_THRESHOLD)
     approximate_max_stream_length: typing.Optional[int] = Field(default=DEFAULT_MAX_LENGTH)
 
     default_redis_host: typing.Optional[str] = Field(default=DEFAULT_REDIS_HOST)
@@ -53,6 +71,7 @@ class _SystemSettings(BaseModel):
     default_redis_user: typing.Optional[str] = Field(default=DEFAULT_REDIS_USER)
     default_redis_password: typing.Optional[str] = Field(default=DEFAULT_REDIS_PASSWORD)
     default_redis_db: typing.Optional[int] = Field(default=DEFAULT_REDIS_DB)
+    redis_max_connections: typing.Optional[int] = Field(default=DEFAULT_REDIS_MAX_CONNECTIONS)
 
     @validator('*', pre=True)
     def _assign_environment_variables(cls, value):
@@ -88,19 +107,23 @@ class _SystemSettings(BaseModel):
 def initialize(system_config_path: typing.Union[str, Path] = None, data: typing.Union[_SystemSettings, str, bytes, dict] = None):
     global settings
 
-    system_config_path = Path(system_config_path) if system_config_path else None
-
-    if system_config_path is None or not system_config_path.exists():
-        system_config_path = DEFAULT_SYSTEM_CONFIG_PATH
-
-    if data and isinstance(data, str):
+    if isinstance(data, _SystemSettings):
+        settings = data
+    elif data and isinstance(data, (str, bytes)):
         settings = _SystemSettings.parse_raw(data)
     elif data and isinstance(data, dict):
         settings = _SystemSettings.parse_obj(data)
-    elif system_config_path.exists():
-        settings = _SystemSettings.parse_file(system_config_path)
     else:
-        raise ValueError(f"Valid input was not available for the creation of system data")
+        # The file system only needs to be checked if the settings weren't passed in directly
+        system_config_path = Path(system_config_path) if system_config_path else None
+
+        if system_config_path is None or not system_config_path.exists():
+            system_config_path = DEFAULT_SYSTEM_CONFIG_PATH
+
+            if not system_config_path.exists():
+                raise ValueError(f"Valid input was not available for the creation of system data")
+
+        settings = _SystemSettings.parse_file(system_config_path)
 
 
 settings = _SystemSettings()
\ No newline at end of file
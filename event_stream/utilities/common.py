@@ -2,21 +2,30 @@
 Contains common functions
 """
 import asyncio
+import base64
 import os
 import typing
 import inspect
+import itertools
 import json
+import linecache
 import math
 import random
 import re
+import sys
+import types
+import zlib
+from functools import lru_cache
 from functools import partial
 
 from .constants import INTEGER_PATTERN
 from .constants import FLOATING_POINT_PATTERN
 from .constants import TRUE_VALUES
+from .constants import TRUE_STRINGS
 from .constants import IDENTIFIER_SAMPLE_SET
 from .constants import IDENTIFIER_LENGTH
 from .constants import BASE_DIRECTORY
+from .constants import COMPRESSED_FIELDS_KEY
 
 from .types import T
 from .types import R
@@ -28,12 +37,77 @@ from event_stream.system import settings
 from event_stream.system import logging
 
 
+def _dump_json_with_standard_library(
+    data: typing.Any,
+    default: typing.Callable[[typing.Any], typing.Any] = None
+) -> bytes:
+    """
+    Serialize data into compact json bytes with the standard library
+
+    Args:
+        data: The data to serialize
+        default: A function used to serialize objects that are not natively supported
+
+    Returns:
+        The json representation of the data as bytes
+    """
+    # The separators match orjson's compact output so that results don't depend on which library is installed
+    return json.dumps(data, default=default, separators=(",", ":")).encode()
+
+
+try:
+    import orjson
+
+    load_json = orjson.loads
+
+    def dump_json(data: typing.Any, default: typing.Callable[[typing.Any], typing.Any] = None) -> bytes:
+        """
+        Serialize data into json bytes
+
+        Args:
+            data: The data to serialize
+            default: A function used to serialize objects that are not natively supported
+
+        Returns:
+            The json representation of the data as bytes
+        """
+        try:
+            # orjson only accepts string keys unless told otherwise, whereas `json` converts them
+            return orjson.dumps(data, default=default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson can't serialize integers wider than 64 bits, which `json` handles just fine
+            return _dump_json_with_standard_library(data, default=default)
+except ImportError:
+    load_json = json.loads
+    dump_json = _dump_json_with_standard_library
+
+
 LIBRARY_FILE_PATTERN = re.compile(r"python\d+\.\d+(?!/site-packages)")
 """
 Pattern that matches on directory names like 'Versions/3.9/lib/python3.9/unittest/async_case.py' to help identify files 
 belonging to Python itself and not third party libraries
 """
 
+_MISSING = object()
+"""Marker for a value that could not be found"""
+
+LITERAL_VALUES: typing.Dict[str, typing.Any] = {
+    "true": True,
+    "false": False,
+    "nan": math.nan,
+    "inf": math.inf,
+    "infinity": math.inf,
+    "-inf": -math.inf,
+    "-infinity": -math.inf,
+}
+"""Case-insensitive string representations of literal values and the values they represent"""
+
+NULL_VALUES = frozenset(("None", "Null", "null", "nil"))
+"""Strings that represent a null value"""
+
+JSON_OPENERS = frozenset(("{", "["))
+"""The characters that may start a json object or array"""
+
 PYTHON_DIRECTORY_PATTERN = re.compile(r"[pP]ython\d+\.\d+/?")
 """
 Pattern that matches on a part of a string that identifies a python version
@@ -63,14 +137,47 @@ def generate_identifier(
     if sample is None:
         sample = IDENTIFIER_SAMPLE_SET
 
-    generated_groups = list()
+    # Most identifiers are a single group, which needs no joining
+    if group_count == 1:
+        return _draw_identifier_group(sample=sample, length=length)
 
-    for _ in range(group_count):
-        generated_groups.append("".join([str(random.choice(sample)) for _ in range(length)]))
+    generated_groups = [
+        _draw_identifier_group(sample=sample, length=length)
+        for _ in range(group_count)
+    ]
 
     return separator.join(generated_groups)
 
 
+def _draw_identifier_group(sample: typing.Sequence, length: int) -> str:
+    """
+    Draw `length` random characters from `sample` with a single call to the random number generator
+
+    One large random integer is split into base-`len(sample)` digits, each of which picks a character. The integer
+    carries twice as many bits as the digits need, so the bias toward lower digits is vanishingly small
+
+    Args:
+        sample: The characters to choose from
+        length: The number of characters to draw
+
+    Returns:
+        The drawn characters joined together
+    """
+    sample_size = len(sample)
+
+    if sample_size == 1:
+        return str(sample[0]) * length
+
+    random_value = random.getrandbits(max(sample_size.bit_length() * length * 2, 1))
+    characters = list()
+
+    for _ in range(length):
+        random_value, index = divmod(random_value, sample_size)
+        characters.append(str(sample[index]))
+
+    return "".join(characters)
+
+
 def generate_group_name(stream_name: str, application_name: str, listener_name: str, *args, **kwargs):
     parts = [stream_name, application_name]
 
@@ -113,26 +220,18 @@ def on_each(
             f" instead of a standard iterable object"
         )
 
-    results: typing.List[R] = list()
-    has_args = len(args) > 0
-    has_kwargs = len(kwargs) > 0
-
-    for value in values:
-        if predicate and not predicate(value):
-            continue
-
-        if has_args and has_kwargs:
-            result = func(value, *args, **kwargs)
-        elif has_kwargs:
-            result = func(value, **kwargs)
-        elif has_args:
-            result = func(value, *args)
-        else:
-            result = func(value)
+    # Bind any extra arguments once so that each element only needs a single call
+    if args or kwargs:
+        def call(value: T) -> R:
+            return func(value, *args, **kwargs)
+    else:
+        call = func
 
-        results.append(result)
+    # `map` keeps the loop in C when every element is used - a comprehension is the next best thing when filtering
+    if predicate is None:
+        return list(map(call, values))
 
-    return results
+    return [call(value) for value in values if predicate(value)]
 
 
 def is_true(value: typing.Union[str, int, bytes, bool, float, None], *, minimum_truth: float = None) -> bool:
@@ -178,8 +277,9 @@ def is_true(value: typing.Union[str, int, bytes, bool, float, None], *, minimum_
     if isinstance(value, bytes):
         value = value.decode()
 
-    if isinstance(value, str) and value == "":
-        return False
+    # Text is the most common input, so check it against the set of true strings before anything else
+    if isinstance(value, str):
+        return value in TRUE_STRINGS
 
     if isinstance(value, int):
         return value != 0
@@ -190,6 +290,30 @@ def is_true(value: typing.Union[str, int, bytes, bool, float, None], *, minimum_
     return value in TRUE_VALUES
 
 
+def walk_stack(depth: int = None) -> typing.Iterator[types.FrameType]:
+    """
+    Step outward through the frames of the calling code
+
+    Unlike `inspect.stack`, no source code is read - use `linecache` for the frames that actually need it
+
+    Args:
+        depth: The number of frames to skip, starting with the code that called `walk_stack`
+
+    Returns:
+        Every frame from the starting point out to the outermost frame
+    """
+    try:
+        # Frame 0 is this generator and frame 1 is whatever is iterating over it
+        frame = sys._getframe(1 + (depth or 0))
+    except ValueError:
+        # The stack isn't deep enough to start where requested
+        return
+
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+
+
 def get_current_function_name(parent_name: bool = None, frame_index: int = None) -> str:
     """
     Gets the name of the current function (i.e. the function that calls `get_current_function_name`)
@@ -212,13 +336,19 @@ def get_current_function_name(parent_name: bool = None, frame_index: int = None)
     Returns:
         The name of the current function
     """
-    stack: typing.List[inspect.FrameInfo] = inspect.stack()[1:]
-
     if frame_index is None:
         frame_index = 1 if parent_name else 0
 
-    caller_info: inspect.FrameInfo = stack[frame_index]
-    return caller_info.function
+    # Indexing from the end requires the whole stack, but other frames may be reached by only walking up to them
+    if frame_index < 0:
+        caller_frame: types.FrameType = list(walk_stack(1))[frame_index]
+    else:
+        caller_frame = next(itertools.islice(walk_stack(1), frame_index, None), None)
+
+        if caller_frame is None:
+            raise IndexError(f"There is no frame at index {frame_index} of the current stack")
+
+    return caller_frame.f_code.co_name
 
 
 def get_stack_trace(
@@ -240,32 +370,32 @@ def get_stack_trace(
     if exclude_fields is None:
         exclude_fields = []
 
-    stack = inspect.stack()
     message_parts = list()
 
-    if get_parent:
-        start_index = 2
-    else:
-        start_index = 1
+    # Skip the frame for the caller as well if the trace is supposed to stop at its parent
+    stack: typing.List[types.FrameType] = list(walk_stack(2 if get_parent else 1))
 
     cut_off_index = None
 
     base_directory_to_replace = str(BASE_DIRECTORY) if str(BASE_DIRECTORY).endswith("/") else str(BASE_DIRECTORY) + "/"
 
-    for frame in reversed(stack[start_index:]):
-        if not (include_all or frame.filename.startswith(str(BASE_DIRECTORY))):
+    for frame in reversed(stack):
+        filename = frame.f_code.co_filename
+
+        if not (include_all or filename.startswith(str(BASE_DIRECTORY))):
             continue
 
+        # Source is only looked up for the frames that make it into the trace
         message = {
-            "function": frame.function,
-            "code": frame.code_context[0].strip() if frame.code_context else "",
-            "lineno": frame.lineno
+            "function": frame.f_code.co_name,
+            "code": linecache.getline(filename, frame.f_lineno).strip(),
+            "lineno": frame.f_lineno
         }
 
-        if frame.filename.startswith(base_directory_to_replace):
-            message['file'] = frame.filename.replace(base_directory_to_replace, "")
+        if filename.startswith(base_directory_to_replace):
+            message['file'] = filename.replace(base_directory_to_replace, "")
         else:
-            message['file'] = PYTHON_DIRECTORY_PATTERN.split(frame.filename)[-1]
+            message['file'] = PYTHON_DIRECTORY_PATTERN.split(filename)[-1]
 
         for key in exclude_fields:
             if key in message:
@@ -297,22 +427,27 @@ def get_stack_depth() -> int:
 
 def get_by_path(data: typing.Dict[str, typing.Any], *path, default=None):
     found_data = data
-    last_index = len(path) - 1
 
-    for path_index, path_part in enumerate(path):
-        data_is_sequence = isinstance(found_data, typing.Sequence) and not isinstance(found_data, (str, bytes))
-        if found_data is None and path_index < last_index:
-            return default
-        elif isinstance(path_part, int) and path_part >= 0 and data_is_sequence:
-            if path_part > len(found_data) - 1:
+    for path_part in path:
+        # Plain dicts and lists are by far the most common containers, so check for them before falling back to the
+        # much slower abstract type checks
+        if isinstance(found_data, dict):
+            found_data = found_data.get(path_part, _MISSING)
+        elif isinstance(found_data, (list, tuple)) or (
+            isinstance(found_data, typing.Sequence) and not isinstance(found_data, (str, bytes))
+        ):
+            if isinstance(path_part, int) and 0 <= path_part < len(found_data):
+                found_data = found_data[path_part]
+            else:
                 return default
-
-            found_data = found_data[path_part]
-        elif isinstance(found_data, typing.Mapping) and path_part in found_data.keys():
-            found_data = found_data[path_part]
+        elif isinstance(found_data, typing.Mapping):
+            found_data = found_data.get(path_part, _MISSING)
         else:
             return default
 
+        if found_data is _MISSING:
+            return default
+
     return found_data
 
 
@@ -327,15 +462,14 @@ def get_environment_variable(
 
     original_value = variable_name
 
-    while variable_name.startswith("$"):
-        variable_name = variable_name[1:]
+    # A single lookup both checks for and retrieves the variable
+    variable_name = variable_name.lstrip("$")
+    value = os.environ.get(variable_name)
 
-    if variable_name not in os.environ:
+    if value is None:
         return default or original_value
 
     try:
-        value = os.environ[variable_name]
-
         if conversion_function:
             value = conversion_function(value)
 
@@ -358,9 +492,57 @@ def json_to_dict_or_list(
         return None
 
     try:
-        return json.loads(data)
-    except:
-        return None
+        return load_json(data)
+    except (ValueError, TypeError):
+        pass
+
+    # orjson is stricter than the standard library (it won't accept values like `NaN`), so give json a chance
+    if load_json is not json.loads:
+        try:
+            return json.loads(data)
+        except (ValueError, TypeError):
+            pass
+
+    return None
+
+
+def is_integer(value: str) -> bool:
+    """
+    Check whether a string represents an integer without running it through `INTEGER_PATTERN`
+
+    Args:
+        value: The string to check
+
+    Returns:
+        Whether the string represents an integer
+    """
+    digits = value[1:] if value[:1] == "-" else value
+
+    if digits.isdecimal():
+        return True
+
+    # The pattern also accepts a trailing newline, so let it decide the rare values that end in one
+    return value.endswith("\n") and INTEGER_PATTERN.match(value) is not None
+
+
+def is_float(value: str) -> bool:
+    """
+    Check whether a string represents a floating point value without running it through `FLOATING_POINT_PATTERN`
+
+    Args:
+        value: The string to check
+
+    Returns:
+        Whether the string represents a floating point value
+    """
+    digits = value[1:] if value[:1] == "-" else value
+    whole, decimal_point, fraction = digits.partition(".")
+
+    if decimal_point and whole.isdecimal() and (not fraction or fraction.isdecimal()):
+        return True
+
+    # The pattern also accepts a trailing newline, so let it decide the rare values that end in one
+    return value.endswith("\n") and FLOATING_POINT_PATTERN.match(value) is not None
 
 
 def interpret_value(value):
@@ -379,44 +561,111 @@ def interpret_value(value):
         ]
     elif not isinstance(value, str):
         data = value
-    elif INTEGER_PATTERN.match(value):
+    elif value[:1] in JSON_OPENERS:
+        # Most payload values are json documents - none of the literal checks below could match them
+        data = json_to_dict_or_list(value) or value
+    elif is_integer(value):
         data = int(value)
-    elif FLOATING_POINT_PATTERN.match(value):
+    elif is_float(value):
         data = float(value)
-    elif value.lower() == "true":
-        data = True
-    elif value.lower() == "false":
-        data = False
-    elif value.lower() == "nan":
-        data = math.nan
-    elif value.lower() in ('inf', 'infinity'):
-        data = math.inf
-    elif value.lower() in ('-inf', '-infinity'):
-        data = -math.inf
-    elif value in ("None", "Null", "null", "nil"):
+    elif value in NULL_VALUES:
         data = None
     else:
-        data = json_to_dict_or_list(value)
+        # A single lookup both checks for and retrieves a literal value
+        data = LITERAL_VALUES.get(value.lower(), _MISSING)
 
-        if not data:
-            data = value
+        if data is _MISSING:
+            data = json_to_dict_or_list(value) or value
 
     return data
 
 
+def compress_fields(fields: typing.Dict[str, typing.Any], threshold: int) -> typing.Dict[str, typing.Any]:
+    """
+    Compress every string or bytes value that is at least `threshold` bytes long
+
+    Compressed values are base64 encoded so that they may still be decoded as text alongside the other fields.
+    The names of the compressed fields are recorded under `COMPRESSED_FIELDS_KEY` so that readers know which
+    values to decompress.
+
+    Args:
+        fields: The key value pairs that will be sent through a stream
+        threshold: The minimum number of bytes a value must have before it is compressed
+
+    Returns:
+        The key value pairs with their large values compressed
+    """
+    compressed_field_names: typing.List[str] = list()
+
+    for field_name, value in fields.items():
+        if isinstance(value, str):
+            value = value.encode()
+        elif not isinstance(value, bytes):
+            continue
+
+        if len(value) < threshold:
+            continue
+
+        compressed_value = base64.b64encode(zlib.compress(value))
+
+        # Small or already dense values may grow when compressed - those are better left alone
+        if len(compressed_value) < len(value):
+            fields[field_name] = compressed_value
+            compressed_field_names.append(field_name)
+
+    if compressed_field_names:
+        fields[COMPRESSED_FIELDS_KEY] = json.dumps(compressed_field_names)
+
+    return fields
+
+
+def decompress_value(value: typing.Union[str, bytes]) -> typing.Union[str, bytes]:
+    """
+    Reverse the compression applied by `compress_fields` on a single value
+
+    Args:
+        value: The compressed value
+
+    Returns:
+        The original value - as a string if it was text and as bytes otherwise
+    """
+    decompressed_value = zlib.decompress(base64.b64decode(value))
+
+    try:
+        return decompressed_value.decode()
+    except UnicodeDecodeError:
+        # Binary fields are handed back just as they were sent
+        return decompressed_value
+
+
 def decode_stream_message(message_payload: PAYLOAD) -> typing.Dict[str, typing.Any]:
     decoded_message = dict()
 
     for key, value in message_payload.items():
         if isinstance(value, bytes):
-            value = value.decode()
+            try:
+                value = value.decode()
+            except UnicodeDecodeError:
+                # Binary values can't be interpreted as text, so they are left as they are
+                pass
 
         if isinstance(key, bytes):
             key = key.decode()
 
-        decoded_message[key] = interpret_value(value)
+        decoded_message[key] = value
 
-    return decoded_message
+    # Values are only interpreted once they are restored since compressed data would otherwise look like plain text
+    compressed_field_names = decoded_message.pop(COMPRESSED_FIELDS_KEY, None)
+
+    if compressed_field_names:
+        for field_name in load_json(compressed_field_names):
+            if field_name in decoded_message:
+                decoded_message[field_name] = decompress_value(decoded_message[field_name])
+
+    return {
+        key: value if isinstance(value, bytes) else interpret_value(value)
+        for key, value in decoded_message.items()
+    }
 
 
 async def fulfill_method(
@@ -479,19 +728,72 @@ async def fulfill_method(
     return result
 
 
-def instanceof(obj: object, object_type: typing.Type) -> bool:
-    def is_generic(cls):
-        if isinstance(cls, typing._GenericAlias):
-            return True
-        if isinstance(cls, typing._SpecialForm):
-            return cls not in {typing.Any}
-        return False
+def _matches_type(value, value_type, deep: bool) -> bool:
+    """
+    Check a single member of a container, avoiding a full check when the value is exactly the expected type
 
-    if not is_generic(object_type):
-        return isinstance(obj, object_type)
+    Args:
+        value: The member to check
+        value_type: The type that the member should be
+        deep: Whether the contents of nested containers should be checked too
+
+    Returns:
+        Whether the value matches the type
+    """
+    return type(value) is value_type or instanceof(value, value_type, deep=deep)
+
+
+@lru_cache(maxsize=1024)
+def _describe_type(object_type: typing.Type) -> typing.Tuple[bool, typing.Optional[typing.Type], bool, tuple]:
+    """
+    Break a type down into the parts `instanceof` needs. The same types tend to be checked over and over, so the
+    results are cached to avoid repeated `typing` introspection
+
+    Args:
+        object_type: The type to describe
+
+    Returns:
+        Whether the type is generic, its origin, whether it is a union, and its generic arguments
+    """
+    if isinstance(object_type, typing._GenericAlias):
+        is_generic = True
+    elif isinstance(object_type, typing._SpecialForm):
+        is_generic = object_type is not typing.Any
+    else:
+        is_generic = False
+
+    if not is_generic:
+        return False, None, False, ()
 
     origin = typing.get_origin(object_type)
-    is_union = origin == typing.Union
+    return True, origin, origin == typing.Union, typing.get_args(object_type)
+
+
+def instanceof(obj: object, object_type: typing.Type, deep: bool = None) -> bool:
+    """
+    Check whether an object matches a type, including the generic arguments of types like `Dict[str, int]`
+
+    Args:
+        obj: The object to check
+        object_type: The type that the object should match
+        deep: Whether every member of a container should be checked rather than only the first. Defaults to True.
+            Iterators are never consumed, so only their type is checked
+
+    Returns:
+        Whether the object matches the type
+    """
+    if deep is None:
+        deep = True
+
+    try:
+        is_generic, origin, is_union, arguments = _describe_type(object_type)
+    except TypeError:
+        # Unhashable types can't be cached, so they have to be described every time
+        is_generic, origin, is_union, arguments = _describe_type.__wrapped__(object_type)
+
+    if not is_generic:
+        return isinstance(obj, object_type)
+
     origin_does_not_match = not is_union and origin is not None and not isinstance(obj, origin)
 
     if origin_does_not_match:
@@ -500,32 +802,36 @@ def instanceof(obj: object, object_type: typing.Type) -> bool:
     # TODO: Add handling for functions
 
     if is_union:
-        arguments = typing.get_args(object_type)
-
         for argument in arguments:
             if argument is None and obj is not None:
                 continue
             elif argument is None:
                 return True
 
-            if instanceof(obj, argument):
+            if instanceof(obj, argument, deep=deep):
                 return True
 
         return False
 
     if isinstance(obj, typing.Mapping):
-        key_type, value_type = typing.get_args(object_type)
+        key_type, value_type = arguments
+        items = obj.items() if deep else itertools.islice(obj.items(), 1)
 
-        for key, value in obj.items():
-            if not instanceof(key, key_type) or not instanceof(value, value_type):
+        for key, value in items:
+            if not _matches_type(key, key_type, deep) or not _matches_type(value, value_type, deep):
                 return False
 
         return True
     elif isinstance(obj, typing.Iterable):
-        value_type: typing.Type = typing.get_args(object_type)[0]
+        # Checking the members of an iterator would use them up, so only its type can be checked
+        if iter(obj) is obj:
+            return True
 
-        for value in obj:
-            if not instanceof(value, value_type):
+        value_type: typing.Type = arguments[0]
+        values = obj if deep else itertools.islice(obj, 1)
+
+        for value in values:
+            if not _matches_type(value, value_type, deep):
                 return False
 
         return True
@@ -536,14 +842,36 @@ def instanceof(obj: object, object_type: typing.Type) -> bool:
         return False
 
 
-def get_concrete_subclasses(cls: typing.Type[T]) -> typing.Iterable[typing.Type[T]]:
-    direct_subclasses = cls.__subclasses__()
-    concrete_subclasses = list()
+def iter_concrete_subclasses(cls: typing.Type[T]) -> typing.Iterator[typing.Type[T]]:
+    """
+    Step through every concrete subclass of the given class, each only once, even if it is reachable through more
+    than one parent
+
+    Args:
+        cls: The class whose subclasses should be found
 
-    for direct_subclass in direct_subclasses:
-        if not inspect.isabstract(direct_subclass):
-            concrete_subclasses.append(direct_subclass)
-        concrete_subclasses.extend(get_concrete_subclasses(direct_subclass))
+    Returns:
+        Every concrete subclass of the class, parents before their children
+    """
+    seen: typing.Set[type] = set()
+
+    # The stack is filled in reverse so that subclasses come out in the order that they were defined
+    remaining_subclasses = list(reversed(cls.__subclasses__()))
+
+    while remaining_subclasses:
+        subclass = remaining_subclasses.pop()
+
+        if subclass in seen:
+            continue
+
+        seen.add(subclass)
+        remaining_subclasses.extend(reversed(subclass.__subclasses__()))
+
+        # Classes that aren't built on `abc` have no `__abstractmethods__` at all
+        if not getattr(subclass, "__abstractmethods__", None):
+            yield subclass
 
-    return concrete_subclasses
+
+def get_concrete_subclasses(cls: typing.Type[T]) -> typing.Iterable[typing.Type[T]]:
+    return list(iter_concrete_subclasses(cls))
 
@@ -4,8 +4,10 @@
 from __future__ import annotations
 
 import typing
-from collections import OrderedDict
-from asyncio import sleep
+import functools
+import hashlib
+import inspect
+import weakref
 from asyncio import gather
 import asyncio as asyncpy
 import threading
@@ -47,6 +49,132 @@ CT = Union[T, typing.Coroutine[Any, Any, T]]
 
 REDIS_CONNECTION = Union[asyncio.Redis, synchronous_redis.Redis]
 
+_LOCK_CONNECTIONS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+"""Synchronous clients used for locking, mapped to the connection pools of the clients that they lock on behalf of"""
+
+SCRIPTING_ERRORS: typing.Tuple[typing.Type[BaseException], ...] = (ImportError, redis.exceptions.ResponseError)
+"""Errors that indicate that Lua scripts cannot be run on a redis instance (generally seen when mocking)"""
+
+COMPLETE_MESSAGE_SCRIPT = """
+redis.call('HSET', KEYS[1], ARGV[1], 1)
+
+for _, complete in ipairs(redis.call('HVALS', KEYS[1])) do
+    if complete ~= '1' then
+        return 0
+    end
+end
+
+redis.call('DEL', KEYS[1])
+redis.call('XACK', KEYS[2], ARGV[2], ARGV[3])
+return 1
+"""
+"""
+Lua that records a consumer's completion of a message and, if every consumer is now done with it, removes its
+record and acknowledges it
+
+KEYS: the record of which consumers have completed the message, the name of the stream
+ARGV: the name of the consumer, the name of the group, the ID of the message
+"""
+
+COMPLETE_MESSAGES_SCRIPT = """
+local statuses = {}
+
+for index = 2, #KEYS do
+    local message_id = ARGV[index + 1]
+    local message_completed = 1
+
+    redis.call('HSET', KEYS[index], ARGV[1], 1)
+
+    for _, complete in ipairs(redis.call('HVALS', KEYS[index])) do
+        if complete ~= '1' then
+            message_completed = 0
+            break
+        end
+    end
+
+    if message_completed == 1 then
+        redis.call('DEL', KEYS[index])
+        redis.call('XACK', KEYS[1], ARGV[2], message_id)
+    end
+
+    table.insert(statuses, message_completed)
+end
+
+return statuses
+"""
+"""
+Lua that works like `COMPLETE_MESSAGE_SCRIPT` for several messages at once and returns 1 for each message that
+was acknowledged and 0 for each message that other consumers still need
+
+KEYS: the name of the stream, followed by the record of which consumers have completed each message
+ARGV: the name of the consumer, the name of the group, followed by the ID of each message
+"""
+
+APPLY_MESSAGE_SCRIPT = """
+local statuses = {}
+
+for _, consumer in ipairs(redis.call('XINFO', 'CONSUMERS', KEYS[2], ARGV[1])) do
+    for index = 1, #consumer, 2 do
+        if consumer[index] == 'name' then
+            local name = consumer[index + 1]
+            redis.call('HSETNX', KEYS[1], name, 0)
+            table.insert(statuses, name)
+            table.insert(statuses, redis.call('HGET', KEYS[1], name))
+        end
+    end
+end
+
+return statuses
+"""
+"""
+Lua that ensures that every consumer in a group has a record of whether it has completed a message and returns
+each consumer's name followed by its status
+
+KEYS: the record of which consumers have completed the message, the name of the stream
+ARGV: the name of the group
+"""
+
+RECORD_FAILURE_SCRIPT = """
+local attempts = redis.call('HINCRBY', KEYS[1], ARGV[1], 1)
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+
+if attempts >= tonumber(ARGV[3]) then
+    return 1
+end
+
+return 0
+"""
+"""
+Lua that counts a failed attempt to handle a message, refreshes how long the count lives, and states whether
+the handler has run out of attempts
+
+KEYS: the record of how many times handlers have failed on the message
+ARGV: the name of the handler, the number of seconds the record should live, the maximum number of attempts
+"""
+
+
+CREATE_CONSUMER_SCRIPT = """
+local created = redis.pcall('XGROUP', 'CREATE', KEYS[1], ARGV[1], '$', 'MKSTREAM')
+
+if type(created) == 'table' and created['err'] then
+    if not string.find(tostring(created['err']), 'BUSYGROUP') then
+        return redis.error_reply(tostring(created['err']))
+    end
+else
+    redis.call('XGROUP', 'CREATECONSUMER', KEYS[1], ARGV[1], ARGV[2])
+end
+
+redis.call('XGROUP', 'CREATECONSUMER', KEYS[1], ARGV[1], ARGV[3])
+return 1
+"""
+"""
+Lua that ensures that a stream and group exist, creating the group's inbox along with the group, and then adds a
+consumer to the group
+
+KEYS: the name of the stream
+ARGV: the name of the group, the name of the inbox consumer, the name of the consumer to create
+"""
+
 
 class LuaSafeLock(Lock):
     """
@@ -79,7 +207,15 @@ class LuaSafeLock(Lock):
         name += f":LOCK"
 
         if not isinstance(connection, synchronous_redis.Redis):
-            connection = connection_type(**connection.connection_pool.connection_kwargs)
+            # Reuse the synchronous client made for this pool rather than opening new connections for every lock
+            connection_pool = connection.connection_pool
+            lock_connection = _LOCK_CONNECTIONS.get(connection_pool)
+
+            if not isinstance(lock_connection, connection_type):
+                lock_connection = connection_type(**connection_pool.connection_kwargs)
+                _LOCK_CONNECTIONS[connection_pool] = lock_connection
+
+            connection = lock_connection
 
         return cls(redis=connection, name=name, blocking=True)
 
@@ -305,6 +441,80 @@ async def get_consumer_messages(
         return messages
 
 
+@functools.lru_cache(maxsize=None)
+def get_script_hash(script: str) -> str:
+    """
+    Get the SHA1 digest that redis uses to identify a Lua script
+
+    Args:
+        script: The Lua script to identify
+
+    Returns:
+        The hex digest of the script
+    """
+    return hashlib.sha1(script.encode()).hexdigest()
+
+
+async def run_script(
+    connection: REDIS_CONNECTION,
+    script: str,
+    keys: typing.Sequence[typing.Union[str, bytes]] = None,
+    args: typing.Sequence[typing.Any] = None
+) -> typing.Any:
+    """
+    Run a Lua script on the redis instance. Scripts are called by their digest so that their bodies are only
+    sent when redis hasn't cached them yet
+
+    Raises errors from `SCRIPTING_ERRORS` if scripts cannot be run on the redis instance
+
+    Args:
+        connection: The connection used to communicate with redis
+        script: The Lua script to run
+        keys: The names of the keys that the script operates on
+        args: Extra values to pass to the script
+
+    Returns:
+        Whatever the script returned
+    """
+    keys = keys or list()
+    args = args or list()
+
+    # The connection is called directly rather than through `fulfill_method` since a missing script is expected
+    # and shouldn't be logged as an error
+    try:
+        result = connection.evalsha(get_script_hash(script), len(keys), *keys, *args)
+
+        if inspect.isawaitable(result):
+            result = await result
+    except NoScriptError:
+        # Redis hasn't seen this script yet - sending the full body will cache it for subsequent calls
+        result = connection.eval(script, len(keys), *keys, *args)
+
+        if inspect.isawaitable(result):
+            result = await result
+
+    return result
+
+
+def install_fast_event_loop() -> bool:
+    """
+    Have asyncio create its event loops with uvloop if it is installed. uvloop spends far less time scheduling
+    callbacks than the default loop, which leaves more time for reading and processing messages
+
+    Must be called before the event loop is started
+
+    Returns:
+        Whether uvloop will be used
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    uvloop.install()
+    return True
+
+
 def connection_is_valid(connection: synchronous_redis.Redis) -> bool:
     try:
         return connection.ping()
@@ -336,9 +546,16 @@ class GroupConsumer:
         self.__connection = connection
         self.__stream_name = stream_name
         self.__group_name = group_name
+
         self.__active = False
         self.__last_processed_message = None
 
+        self.__pending_acknowledgements: typing.List[typing.Union[str, bytes]] = list()
+        """The IDs of processed messages waiting to be marked as processed together"""
+
+        self.__acknowledgement_timer: typing.Optional[asyncpy.Task] = None
+        """A task that will mark the pending messages as processed once they have waited long enough"""
+
         # TODO: Would it make more sense to name the consumer after the application instance
         #  and not just a random identifier?
         self.__consumer_name = consumer_name or f"{group_name}:{generate_identifier(length=4)}"
@@ -389,42 +606,43 @@ class GroupConsumer:
         """
         Create a new consumer within the redis instance
         """
+        try:
+            # Create the stream, group, inbox, and consumer in a single round trip. Redis runs scripts atomically,
+            # so there's no need to lock
+            await run_script(
+                self.connection,
+                CREATE_CONSUMER_SCRIPT,
+                keys=[self.stream_name],
+                args=[self.group_name, settings.consumer_inbox_name, self.consumer_name]
+            )
+        except SCRIPTING_ERRORS:
+            # Lua isn't available, so each step needs to be performed manually
+            await self.__create_consumer_manually()
+
+        self.__active = True
+
+    async def __create_consumer_manually(self):
+        """
+        Create a new consumer within the redis instance one step at a time
+        """
         # Lock the group to ensure that other instances of the application cannot hinder this creation process
         with secure_lock(main_connection=self.connection, stream_name=self.stream_name, group_name=self.group_name):
-            # First ensure that the group exists
-            # If there's no key, there's no stream and if there's no stream there's no group
-            stream_exists = await self.connection.exists(self.stream_name)
-
-            # If it was determined that the stream is present, check to see if the group is present
-            if stream_exists:
-                # Search for a group within the stream
-                matching_group = [
-                    group
-                    for group in await self.__connection.xinfo_groups(self.stream_name)
-                    if group.get("name") == self.group_name.encode()
-                ]
-
-                # If there isn't a matching group, we need to create one
-                create_group = len(matching_group) == 0
-            else:
-                # If the stream doesn't exist, we need to create a group to register the stream
-                create_group = True
-
-            if create_group:
-                try:
-                    await self.connection.xgroup_create(name=self.stream_name, groupname=self.group_name, mkstream=True)
-
-                    # Create the inbox - this will be used to store messages that haven't completed processing
-                    # within the group
-                    await self.connection.xgroup_createconsumer(
-                        name=self.stream_name,
-                        groupname=self.group_name,
-                        consumername=settings.consumer_inbox_name
-                    )
-                except asyncio.ResponseError as response_error:
-                    if "BUSYGROUP" not in str(response_error):
-                        raise
-                    # This stream and group got created, so there's no need to worry
+            # Creating the group with `mkstream` either creates the stream and group or fails with BUSYGROUP because
+            # the group is already there, so there's no need to look for the stream or group beforehand
+            try:
+                await self.connection.xgroup_create(name=self.stream_name, groupname=self.group_name, mkstream=True)
+
+                # Create the inbox - this will be used to store messages that haven't completed processing
+                # within the group
+                await self.connection.xgroup_createconsumer(
+                    name=self.stream_name,
+                    groupname=self.group_name,
+                    consumername=settings.consumer_inbox_name
+                )
+            except asyncio.ResponseError as response_error:
+                if "BUSYGROUP" not in str(response_error):
+                    raise
+                # This stream and group got created, so there's no need to worry
 
             # Now that we're sure there is a group, go ahead and create the consumer
 
@@ -437,9 +655,7 @@ class GroupConsumer:
                 consumername=self.consumer_name
             )
 
-        self.__active = True
-
-    async def read(self, block_ms: int = None) -> typing.Mapping[str, typing.Dict[str, str]]:
+    async def read(self, block_ms: int = None, count: int = None) -> typing.Mapping[str, typing.Dict[str, str]]:
         """
         Read data from the stream into the group and assign it to the consumer
 
@@ -449,6 +665,7 @@ class GroupConsumer:
 
         Args:
             block_ms: The number of milliseconds to wait for a response
+            count: The maximum number of new messages to read at once. Defaults to `settings.read_batch_size`
 
         Returns:
             The data that was read organized into an easy-to-read structure
@@ -459,7 +676,8 @@ class GroupConsumer:
             stream=self.stream_name,
             group=self.group_name,
             consumer=self.consumer_name,
-            block_ms=block_ms
+            block_ms=block_ms,
+            count=count
         )
 
     async def remove_consumer(self):
@@ -467,6 +685,12 @@ class GroupConsumer:
         Remove the consumer from the group attached to the stream
         """
         # No need to block - there shouldn't be any other similar consumers
+        try:
+            # Messages that were already processed shouldn't be handed to the inbox for another round of processing
+            await self.flush_acknowledgements()
+        except Exception as exception:
+            logging.error("Could not mark processed messages as processed before closing a redis consumer", exception)
+
         try:
             # Make sure to move all currently owned messages back to the inbox so that new instances may read them
             await transfer_messages_to_inbox(
@@ -517,6 +741,98 @@ class GroupConsumer:
 
         return marked_as_complete
 
+    async def mark_messages_processed(self, message_ids: typing.Sequence[typing.Union[str, bytes]]) -> int:
+        """
+        Set several messages as processed and kick them out of the group with as few calls to redis as possible
+
+        Args:
+            message_ids: The IDs of the messages to kick out of the group
+
+        Returns:
+            The number of messages that were completely removed
+        """
+        if not message_ids:
+            return 0
+
+        completed_message_ids = await mark_messages_as_complete(
+            connection=self.connection,
+            stream_name=self.stream_name,
+            group_name=self.group_name,
+            consumer_name=self.consumer_name,
+            message_ids=message_ids
+        )
+
+        if completed_message_ids:
+            self.__last_processed_message = completed_message_ids[-1]
+
+        return len(completed_message_ids)
+
+    async def acknowledge(self, message_id: typing.Union[str, bytes]):
+        """
+        Queue a processed message so that it may be marked as processed alongside others in as few calls to redis
+        as possible
+
+        The queue is flushed once `settings.acknowledgement_batch_size` messages are waiting or once the first of
+        them has waited `settings.acknowledgement_delay_ms` milliseconds, whichever comes first
+
+        Args:
+            message_id: The ID of the message that was processed
+        """
+        self.__pending_acknowledgements.append(message_id)
+
+        if len(self.__pending_acknowledgements) >= settings.acknowledgement_batch_size:
+            await self.flush_acknowledgements()
+        elif self.__acknowledgement_timer is None:
+            self.__acknowledgement_timer = asyncpy.create_task(self.__flush_acknowledgements_later())
+
+    async def flush_acknowledgements(self) -> int:
+        """
+        Mark every queued message as processed
+
+        Returns:
+            The number of messages that were completely removed
+        """
+        if self.__acknowledgement_timer is not None:
+            self.__acknowledgement_timer.cancel()
+            self.__acknowledgement_timer = None
+
+        message_ids = self.__pending_acknowledgements
+        self.__pending_acknowledgements = list()
+
+        return await self.mark_messages_processed(message_ids)
+
+    async def __flush_acknowledgements_later(self):
+        """
+        Wait for more messages to be queued, then mark everything in the queue as processed
+        """
+        await asyncpy.sleep(settings.acknowledgement_delay_ms / 1000)
+
+        # Let go of the timer before flushing so that a flush elsewhere won't cancel this one partway through
+        self.__acknowledgement_timer = None
+
+        try:
+            await self.flush_acknowledgements()
+        except Exception as exception:
+            logging.error(f"Could not mark queued messages in {self} as processed", exception)
+
+    async def record_failure(self, message_id: typing.Union[str, bytes], handler_name: str) -> bool:
+        """
+        Count a failed attempt by a handler to process a message
+
+        Args:
+            message_id: The ID of the message that could not be processed
+            handler_name: The name of the handler that failed
+
+        Returns:
+            Whether the handler has run out of attempts to process the message
+        """
+        return await record_failed_attempt(
+            connection=self.connection,
+            group_name=self.group_name,
+            message_id=message_id,
+            handler_name=handler_name
+        )
+
     async def give_up_message(self, message_id: typing.Union[str, bytes], *, give_to: str = None):
         """
         Release the message to another consumer for processing. Hands the message back to the inbox unless
@@ -583,6 +899,26 @@ def get_id_from_message(message: typing.Tuple[bytes, typing.Dict[bytes, bytes]])
     return message_id
 
 
+def get_message_order(message: typing.Tuple[typing.Union[str, bytes], typing.Dict]) -> typing.Tuple[int, int]:
+    """
+    Get a sort key that orders stream messages the way redis does - by when they were added and then by their
+    sequence number. Comparing the IDs as strings would put '1-10' ahead of '1-9'
+
+    Args:
+        message: A message ID and its payload
+
+    Returns:
+        The time that the message was added and its sequence number
+    """
+    message_id = message[0]
+
+    if isinstance(message_id, bytes):
+        message_id = message_id.decode()
+
+    milliseconds, _, sequence = message_id.partition("-")
+    return int(milliseconds), int(sequence or 0)
+
+
 def organize_stream_messages(
     incoming_messages: STREAMS
 ) -> typing.Mapping[str, typing.Dict[str, typing.Dict]]:
@@ -635,14 +971,11 @@ def organize_messages(messages: typing.Iterable[typing.Tuple[bytes, dict]]) -> t
     Returns:
         A dictionary of message ids mapped to payloads
     """
-    organized_messages = OrderedDict()
-
-    for message_id, payload in sorted(messages, key=get_id_from_message):
-        key = message_id.decode() if isinstance(message_id, bytes) else message_id
-        value = payload.decode() if isinstance(payload, bytes) else payload
-        organized_messages[key] = value
-
-    return organized_messages
+    # Dictionaries keep their insertion order, so the sorted messages can be gathered in a single pass
+    return {
+        message_id.decode() if isinstance(message_id, bytes) else message_id: payload
+        for message_id, payload in sorted(messages, key=get_message_order)
+    }
 
 
 async def read_from_stream(
@@ -651,7 +984,8 @@ async def read_from_stream(
     group: typing.Union[str, bytes],
     consumer: typing.Union[str, bytes],
     message_id: str = None,
-    block_ms: int = None
+    block_ms: int = None,
+    count: int = None
 ) -> typing.Mapping[str, typing.Dict]:
     """
     Read all indicated data from a stream and assign it to the given consumer
@@ -665,6 +999,8 @@ async def read_from_stream(
         consumer: The consumer that will 'own' the message in the group
         message_id: The exclusive minimum message to retrieve. Defaults to '>' for all messages
         block_ms: The amount of milliseconds to block, waiting for a message to come through
+        count: The maximum number of new messages to read from the stream at once.
+            Defaults to `settings.read_batch_size`
 
     Returns:
         All retrieved messages
@@ -672,9 +1008,17 @@ async def read_from_stream(
     if message_id is None:
         message_id = ">"
 
+    # Bound every read so that one round trip brings back a full batch without flooding the caller
+    if count is None:
+        count = settings.read_batch_size
+
     if block_ms is None:
         block_ms = DEFAULT_BLOCK_MILLISECONDS
 
+    # Neither the stream to read from nor the name its messages will be organized under change between polls
+    streams_to_read = {stream: message_id}
+    stream_name = stream if isinstance(stream, str) else stream.decode()
+
     # Loop until at least one message is retrieved. This is where the polling occurs
     while True:
         # First try to get unused messages within the group
@@ -694,23 +1038,22 @@ async def read_from_stream(
             connection.xreadgroup,
             groupname=group,
             consumername=consumer,
-            streams={stream: message_id},
-            block=block_ms
+            streams=streams_to_read,
+            block=block_ms,
+            count=count
         )
 
         # format the messagges to be easier to query
         messages = organize_stream_messages(incoming_messages)
 
         # Try to extract all messages that belong to the stream here
-        messages_to_return = messages.get(stream if isinstance(stream, str) else stream.decode())
+        messages_to_return = messages.get(stream_name)
 
-        # If messages from the stream were claimed, return those for processing
+        # If messages from the stream were claimed, return those for processing. Otherwise the read already blocked
+        # for `block_ms` on the server, so there's no need to wait any longer before checking again
         if messages_to_return is not None and len(messages_to_return) > 0:
             return messages_to_return
 
-        # If no messages are found, wait a little bit and try again
-        await sleep(1)
-
 
 async def get_messages_from_inbox(
     connection: REDIS_CONNECTION,
@@ -764,18 +1107,61 @@ async def get_idle_messages(
     if idle_time is None:
         idle_time = settings.max_idle_time
 
+    # Use a set so that checking each pending message against the exclusions doesn't require a scan.
+    # Message IDs may come back as either strings or bytes depending on the connection, so both forms are stored
     if exclude is None:
-        exclude = list()
+        exclude = frozenset()
     else:
-        exclude = [
-            entry.encode() if isinstance(entry, str) else entry
+        exclude = frozenset(
+            form
             for entry in exclude
-        ]
+            for form in ((entry, entry.encode()) if isinstance(entry, str) else (entry, entry.decode()))
+        )
 
     # TODO: Start out by checking for any sort of messages that belong exclusively to this consumer. While the future
     #  check for pending messages MAY find the messages to process, start with this consumer since they w
 
     with secure_lock(stream_name=stream, group_name=group, main_connection=connection):
+        # Without exclusions, every idle message may be taken, so XAUTOCLAIM can find and claim them together
+        if not exclude:
+            try:
+                newly_claimed_messages = list()
+                start_id = "0-0"
+
+                # XAUTOCLAIM works through the pending entries in pages - a cursor of '0-0' means that there are none
+                # left. A cursor that doesn't move (seen with mocked connections) is treated the same way
+                while True:
+                    previous_start_id = start_id
+
+                    # The connection is called directly rather than through `fulfill_method` since older instances
+                    # are expected to reject XAUTOCLAIM and that shouldn't be logged as an error
+                    claim_result = connection.xautoclaim(
+                        name=stream,
+                        groupname=group,
+                        consumername=consumer,
+                        min_idle_time=idle_time,
+                        start_id=start_id,
+                        count=99
+                    )
+
+                    if inspect.isawaitable(claim_result):
+                        claim_result = await claim_result
+
+                    start_id, claimed_page, *_ = claim_result
+
+                    # Redis 6.2 reports entries that were deleted while pending without IDs - there's nothing to process
+                    newly_claimed_messages.extend(
+                        (message_id, payload)
+                        for message_id, payload in claimed_page
+                        if message_id is not None
+                    )
+
+                    if start_id in ("0-0", b"0-0", previous_start_id):
+                        return organize_messages(newly_claimed_messages)
+            except redis.exceptions.ResponseError as error:
+                # XAUTOCLAIM is only available on Redis 6.2+ - older instances need to scan and claim separately
+                logging.debug(f"Could not automatically claim idle messages: {error}")
+
         stale_messages_information = await fulfill_method(
             connection.xpending_range,
             name=stream,
@@ -925,6 +1311,83 @@ async def add_consumer(
     return consumer_created, group_created
 
 
+async def add_consumers(
+    connection: REDIS_CONNECTION,
+    stream_name: str,
+    group_name: str,
+    consumer_names: typing.Sequence[str],
+    lock_connection: synchronous_redis.Redis = None,
+    lock: LuaSafeLock = None
+) -> typing.Tuple[typing.Dict[str, bool], bool]:
+    """
+    Adds several consumers to a group for a stream, creating the stream, group, and inbox if needed, in a
+    single round trip
+
+    Args:
+        connection: The connection to the redis instance
+        stream_name: The name of the stream that the group belongs to
+        group_name: The name of the group to add the consumers to
+        consumer_names: The names of the consumers to add
+        lock_connection: A dedicated connection used for creating locks
+        lock: A lock that has already been created
+
+    Returns:
+        A 2-tuple of the consumer names mapped to whether they were created and whether the group was created
+    """
+    lock = secure_lock(
+        stream_name=stream_name,
+        group_name=group_name,
+        main_connection=connection,
+        lock_connection=lock_connection,
+        lock=lock
+    )
+
+    with lock:
+        pipeline = connection.pipeline(transaction=False)
+        pipeline.xgroup_create(name=stream_name, groupname=group_name, mkstream=True)
+        pipeline.xgroup_createconsumer(
+            name=stream_name,
+            groupname=group_name,
+            consumername=settings.consumer_inbox_name
+        )
+
+        for consumer_name in consumer_names:
+            pipeline.xgroup_createconsumer(name=stream_name, groupname=group_name, consumername=consumer_name)
+
+        pipeline.xinfo_consumers(name=stream_name, groupname=group_name)
+
+        # Errors are returned in place of results so that an existing group doesn't stop the consumers from being made
+        group_result, _, *consumer_results, updated_consumer_info = await fulfill_method(
+            pipeline.execute,
+            raise_on_error=False
+        )
+
+    for result in (group_result, *consumer_results, updated_consumer_info):
+        if isinstance(result, BaseException) and "BUSYGROUP" not in str(result):
+            raise result
+
+    group_created = not isinstance(group_result, BaseException) and is_true(group_result)
+    consumers_created = {
+        consumer_name: not isinstance(result, BaseException) and is_true(result)
+        for consumer_name, result in zip(consumer_names, consumer_results)
+    }
+
+    attached_consumer_names = {
+        consumer['name'].decode() if isinstance(consumer['name'], bytes) else consumer['name']
+        for consumer in updated_consumer_info
+    }
+
+    missing_consumer_names = [name for name in consumer_names if name not in attached_consumer_names]
+
+    if missing_consumer_names:
+        raise Exception(
+            f"The {', '.join(missing_consumer_names)} consumer(s) for the '{group_name}' group could not "
+            f"be attached to the '{stream_name}' stream"
+        )
+
+    return consumers_created, group_created
+
+
 async def add_group(
     connection: REDIS_CONNECTION,
     stream_name: str,
@@ -988,6 +1451,44 @@ async def remove_stream(connection: REDIS_CONNECTION, stream_name: str):
     await fulfill_method(connection.delete, stream_name)
 
 
+async def remove_streams(connection: REDIS_CONNECTION, stream_names: typing.Iterable[str]) -> int:
+    """
+    Remove several streams, along with their groups, in a single call
+
+    Args:
+        connection: The connection to the redis instance
+        stream_names: The names of the streams to remove
+
+    Returns:
+        The number of streams that were removed
+    """
+    stream_names = list(stream_names)
+
+    if not stream_names:
+        return 0
+
+    # Deleting a stream's key takes its groups and consumers with it, so there's no need to destroy them one by one
+    return await fulfill_method(connection.delete, *stream_names)
+
+
+def get_message_record_key(group_name: str, message_id: typing.Union[str, bytes]) -> str:
+    """
+    Get the name of the hash that records which consumers in a group have completed a message
+
+    Args:
+        group_name: The name of the group that the consumers belong to
+        message_id: The ID of the message
+
+    Returns:
+        The name of the hash for the message
+    """
+    # Decode byte IDs so that `b'123-0'` and `'123-0'` share a record
+    if isinstance(message_id, bytes):
+        message_id = message_id.decode()
+
+    return group_name + ":" + message_id
+
+
 async def add_record_to_consumer(
     connection: REDIS_CONNECTION,
     group_name: str,
@@ -995,14 +1496,37 @@ async def add_record_to_consumer(
     message_id: str,
     record: dict
 ):
-    name = f"{group_name}:{message_id}"
-    await fulfill_method(connection.hsetnx, name=name, key=consumer_name, value=int(False))
-    record[consumer_name] = is_true(await fulfill_method(connection.hget, name=name, key=consumer_name))
+    name = get_message_record_key(group_name, message_id)
+
+    # Add the record and read it back in the same round trip
+    pipeline = connection.pipeline(transaction=False)
+    pipeline.hsetnx(name=name, key=consumer_name, value=int(False))
+    pipeline.hget(name=name, key=consumer_name)
+    _, status = await fulfill_method(pipeline.execute)
+
+    record[consumer_name] = is_true(status)
 
 
 async def apply_message_to_all(connection: REDIS_CONNECTION, stream_name: str, group_name: str, message_id: str):
     entries: typing.Dict[str, bool] = dict()
 
+    try:
+        # Redis runs scripts atomically, so no lock is needed to keep the consumers from changing mid-application
+        statuses = await run_script(
+            connection,
+            APPLY_MESSAGE_SCRIPT,
+            keys=[get_message_record_key(group_name, message_id), stream_name],
+            args=[group_name]
+        )
+    except SCRIPTING_ERRORS:
+        statuses = None
+
+    if statuses is not None:
+        for consumer_name, status in zip(statuses[::2], statuses[1::2]):
+            entries[consumer_name.decode() if isinstance(consumer_name, bytes) else consumer_name] = is_true(status)
+        return entries
+
+    # Lua isn't available, so the group needs to be locked while each record is added manually
     with secure_lock(stream_name=stream_name, group_name=group_name, main_connection=connection, message_id=message_id):
         consumers: typing.Sequence[dict] = await get_all_consumers(
             connection=connection,
@@ -1032,7 +1556,7 @@ async def message_is_applied_to_all(
     group_name: str,
     message_id: str
 ) -> bool:
-    key = f"{group_name}:{message_id}"
+    key = get_message_record_key(group_name, message_id)
     with secure_lock(main_connection=connection, stream_name=stream_name, group_name=group_name, message_id=message_id):
         return is_true(await fulfill_method(connection.exists, key))
 
@@ -1043,7 +1567,7 @@ async def get_universal_message_status(
     group_name: str,
     message_id: str
 ) -> typing.Dict[str, bool]:
-    key = f"{group_name}:{message_id}"
+    key = get_message_record_key(group_name, message_id)
 
     with secure_lock(main_connection=connection, stream_name=stream_name, group_name=group_name, message_id=message_id):
         status = {
@@ -1076,26 +1600,182 @@ async def mark_message_as_complete(
     Returns:
         True if the record is truly removed, False if it was just moved to the inbox
     """
-    key = f"{group_name}:{message_id}"
+    key = get_message_record_key(group_name, message_id)
 
-    with secure_lock(main_connection=connection, stream_name=stream_name, group_name=group_name, message_id=message_id):
-        await fulfill_method(connection.hset, name=key, key=consumer_name, value=int(True))
+    try:
+        # Record the completion, check the other consumers, and acknowledge the message in one round trip.
+        # Redis runs scripts atomically, so there's no need to lock
+        message_completed = is_true(
+            await run_script(
+                connection,
+                COMPLETE_MESSAGE_SCRIPT,
+                keys=[key, stream_name],
+                args=[consumer_name, group_name, message_id]
+            )
+        )
+    except SCRIPTING_ERRORS:
+        # Lua isn't available, so the message needs to be locked while each step is performed manually
+        with secure_lock(
+            main_connection=connection,
+            stream_name=stream_name,
+            group_name=group_name,
+            message_id=message_id
+        ):
+            await fulfill_method(connection.hset, name=key, key=consumer_name, value=int(True))
+
+            message_completed = all(
+                is_true(complete)
+                for complete in (await fulfill_method(connection.hgetall, key)).values()
+            )
+
+            if message_completed:
+                await fulfill_method(connection.delete, key)
+                await fulfill_method(connection.xack, stream_name, group_name, message_id)
+
+    if message_completed:
+        return True
+
+    # XCLAIM is atomic on its own, so returning the message doesn't need the lock either
+    await return_message_to_inbox(
+        connection=connection,
+        message_id=message_id,
+        stream_name=stream_name,
+        group_name=group_name
+    )
+    return False
+
+
+async def mark_messages_as_complete(
+    connection: REDIS_CONNECTION,
+    stream_name: str,
+    group_name: str,
+    consumer_name: str,
+    message_ids: typing.Sequence[typing.Union[str, bytes]]
+) -> typing.Sequence[typing.Union[str, bytes]]:
+    """
+    Mark the processing of several messages by this particular consumer as complete
+
+    Works like `mark_message_as_complete`, but every completion is recorded with a single script call and every
+    message still needed by other consumers is returned to the inbox with a single XCLAIM
+
+    Args:
+        connection: The connection used to communicate with redis
+        stream_name: The name of the stream that the messages came from
+        group_name: The name of the group that the consumer belongs to
+        consumer_name: The name of the consumer that finished processing the messages
+        message_ids: The IDs of the messages that were processed
+
+    Returns:
+        The IDs of the messages that were truly removed
+    """
+    completed_message_ids: typing.List[typing.Union[str, bytes]] = list()
+    incomplete_message_ids: typing.List[typing.Union[str, bytes]] = list()
+
+    decoded_message_ids = [
+        message_id.decode() if isinstance(message_id, bytes) else message_id
+        for message_id in message_ids
+    ]
+    keys = [
+        get_message_record_key(group_name, message_id)
+        for message_id in decoded_message_ids
+    ]
 
-        number_of_incomplete_processes = sum(
-            1
-            for complete in (await fulfill_method(connection.hgetall, key)).values()
-            if not is_true(complete)
+    try:
+        # Record every completion, check the other consumers, and acknowledge finished messages in one round trip.
+        # Redis runs scripts atomically, so there's no need to lock
+        statuses = await run_script(
+            connection,
+            COMPLETE_MESSAGES_SCRIPT,
+            keys=[stream_name, *keys],
+            args=[consumer_name, group_name, *decoded_message_ids]
         )
 
-        if number_of_incomplete_processes == 0:
-            await fulfill_method(connection.delete, key)
-            await fulfill_method(connection.xack, stream_name, group_name, message_id)
-            return True
-        else:
-            await return_message_to_inbox(
-                connection=connection,
-                message_id=message_id,
+        for message_id, message_completed in zip(message_ids, statuses):
+            if is_true(message_completed):
+                completed_message_ids.append(message_id)
+            else:
+                incomplete_message_ids.append(message_id)
+    except SCRIPTING_ERRORS:
+        # Lua isn't available, so each message needs to be locked while its completion is recorded manually
+        completed_keys: typing.List[str] = list()
+
+        for message_id, decoded_message_id, key in zip(message_ids, decoded_message_ids, keys):
+            with secure_lock(
+                main_connection=connection,
                 stream_name=stream_name,
-                group_name=group_name
+                group_name=group_name,
+                message_id=decoded_message_id
+            ):
+                # Record this consumer's completion and read back everyone else's in the same round trip
+                pipeline = connection.pipeline(transaction=False)
+                pipeline.hset(name=key, key=consumer_name, value=int(True))
+                pipeline.hgetall(key)
+                _, statuses = await fulfill_method(pipeline.execute)
+
+            if all(is_true(complete) for complete in statuses.values()):
+                completed_message_ids.append(message_id)
+                completed_keys.append(key)
+            else:
+                incomplete_message_ids.append(message_id)
+
+        if completed_message_ids:
+            pipeline = connection.pipeline(transaction=False)
+            pipeline.delete(*completed_keys)
+            pipeline.xack(stream_name, group_name, *completed_message_ids)
+            await fulfill_method(pipeline.execute)
+
+    if incomplete_message_ids:
+        await fulfill_method(
+            connection.xclaim,
+            name=stream_name,
+            groupname=group_name,
+            consumername=settings.consumer_inbox_name,
+            min_idle_time=0,
+            message_ids=incomplete_message_ids
+        )
+
+    return completed_message_ids
+
+
+async def record_failed_attempt(
+    connection: REDIS_CONNECTION,
+    group_name: str,
+    message_id: typing.Union[str, bytes],
+    handler_name: str,
+    max_attempts: int = None
+) -> bool:
+    """
+    Count a failed attempt by a handler to process a message
+
+    Args:
+        connection: The connection used to communicate with redis
+        group_name: The name of the group that the handler belongs to
+        message_id: The ID of the message that could not be processed
+        handler_name: The name of the handler that failed
+        max_attempts: The number of failures allowed before a handler should give up on a message
+
+    Returns:
+        Whether the handler has run out of attempts to process the message
+    """
+    if max_attempts is None:
+        max_attempts = settings.max_handler_attempts
+
+    key = get_message_record_key(group_name, message_id) + settings.key_separator + "ATTEMPTS"
+    lifetime = int(settings.key_lifetime_seconds.total_seconds())
+
+    try:
+        # Count the failure and compare it to the limit in one atomic round trip
+        return is_true(
+            await run_script(
+                connection,
+                RECORD_FAILURE_SCRIPT,
+                keys=[key],
+                args=[handler_name, lifetime, max_attempts]
             )
-            return False
\ No newline at end of file
+        )
+    except SCRIPTING_ERRORS:
+        pipeline = connection.pipeline(transaction=True)
+        pipeline.hincrby(key, handler_name, 1)
+        pipeline.expire(key, lifetime)
+        attempts, _ = await fulfill_method(pipeline.execute)
+        return int(attempts) >= max_attempts
@@ -37,6 +37,12 @@ TRUE_VALUES = (
 )
 """Values that may be considered as `True`"""
 
+TRUE_STRINGS = frozenset(value for value in TRUE_VALUES if isinstance(value, str))
+"""The textual values that may be considered as `True`, stored for constant time lookup"""
+
+COMPRESSED_FIELDS_KEY = "__compressed__"
+"""The reserved stream field listing which other fields of a message were compressed before being sent"""
+
 IDENTIFIER_SAMPLE_SET = string.hexdigits
 """A collection of values that may be used to form a unique id"""
 
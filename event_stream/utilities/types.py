@@ -3,9 +3,12 @@
 """
 from __future__ import annotations
 import asyncio
+import functools
 import inspect
+import sys
 import typing
 import importlib
+import weakref
 from types import ModuleType
 
 from typing import (
@@ -29,6 +32,8 @@ from typing_extensions import ParamSpec
 
 from redis.asyncio import Redis
 
+from event_stream.system import settings
+
 T = TypeVar("T")
 """Indicates a general type of object"""
 
@@ -41,7 +46,23 @@ C_T = Union[T, Coroutine[Any, Any, T]]
 P = ParamSpec("P")
 """Indicates *args and **kwargs parameters"""
 
-_IMPORTED_LIBRARIES: typing.Dict[str, ModuleType] = dict()
+_VAR_KEYWORD = inspect.Parameter.VAR_KEYWORD
+"""The kind of parameter that accepts `**kwargs`"""
+
+_VAR_POSITIONAL = inspect.Parameter.VAR_POSITIONAL
+"""The kind of parameter that accepts `*args`"""
+
+_VARYING_KINDS = frozenset({_VAR_POSITIONAL, _VAR_KEYWORD})
+"""The kinds of parameters that accept a variable number of arguments"""
+
+_EMPTY_ANNOTATION = inspect.Parameter.empty
+"""The marker indicating that a parameter or return value has not been annotated"""
+
+_VALIDATED_HANDLERS: weakref.WeakSet = weakref.WeakSet()
+"""
+Handlers that have already passed `enforce_handler`. Kept outside of the handlers themselves so that wrappers 
+copying a handler's attributes aren't mistaken for validated handlers
+"""
 
 
 @runtime_checkable
@@ -95,7 +116,7 @@ class ConsumerProtocol(Protocol):
         """
         ...
 
-    async def read(self, block_ms: int = None) -> typing.Mapping[str, typing.Dict[str, str]]:
+    async def read(self, block_ms: int = None, count: int = None) -> typing.Mapping[str, typing.Dict[str, str]]:
         """
         Read data from the stream into the group and assign it to the consumer
 
@@ -105,6 +126,7 @@ class ConsumerProtocol(Protocol):
 
         Args:
             block_ms: The number of milliseconds to wait for a response
+            count: The maximum number of new messages to read at once. Defaults to `settings.read_batch_size`
 
         Returns:
             The data that was read organized into an easy-to-read structure
@@ -132,6 +154,49 @@ class ConsumerProtocol(Protocol):
         # No need to lock - this will be contained within the context of this consumer
         ...
 
+    async def mark_messages_processed(self, message_ids: typing.Sequence[typing.Union[str, bytes]]) -> int:
+        """
+        Set several messages as processed and kick them out of the group with a single acknowledgement
+
+        Args:
+            message_ids: The IDs of the messages to kick out of the group
+
+        Returns:
+            The number of messages that were completely removed
+        """
+        ...
+
+    async def acknowledge(self, message_id: typing.Union[str, bytes]):
+        """
+        Queue a processed message so that it may be marked as processed alongside others
+
+        Args:
+            message_id: The ID of the message that was processed
+        """
+        ...
+
+    async def flush_acknowledgements(self) -> int:
+        """
+        Mark every queued message as processed
+
+        Returns:
+            The number of messages that were completely removed
+        """
+        ...
+
+    async def record_failure(self, message_id: typing.Union[str, bytes], handler_name: str) -> bool:
+        """
+        Count a failed attempt by a handler to process a message
+
+        Args:
+            message_id: The ID of the message that could not be processed
+            handler_name: The name of the handler that failed
+
+        Returns:
+            Whether the handler has run out of attempts to process the message
+        """
+        ...
+
     async def give_up_message(self, message_id: typing.Union[str, bytes], *, give_to: str = None):
         """
         Release the message to another consumer for processing. Hands the message back to the inbox unless
@@ -276,6 +341,13 @@ class ReaderProtocol(Protocol):
     ) -> typing.Optional[typing.Union[typing.Sequence, MessageProtocol, BaseException]]:
         ...
 
+    async def process_messages(
+        self,
+        consumer: ConsumerProtocol,
+        messages: typing.Mapping[str, typing.Dict[str, typing.Any]]
+    ) -> typing.Dict[str, typing.Optional[typing.Union[typing.Sequence, MessageProtocol, BaseException]]]:
+        ...
+
     async def listen(self):
         ...
 
@@ -348,13 +420,97 @@ Examples:
 PAYLOAD = Union[Dict[str, str], Dict[bytes, bytes]]
 """The type of data that will accompany a stream message as input data"""
 
+_HANDLER_PARAMETERS, _HANDLER_RETURN_TYPE = typing.get_args(HANDLER_FUNCTION)
+"""The parameters and return type that every handler must comply with"""
+
+_HANDLER_ELLIPSIS_INDEX: Optional[int] = next(
+    (index for index, parameter in enumerate(_HANDLER_PARAMETERS) if parameter is Ellipsis),
+    None
+)
+"""Where an Ellipsis appears in the handler parameters, if at all - nothing after it needs to be checked"""
+
+_HANDLER_REQUIRES_KWARGS = _HANDLER_ELLIPSIS_INDEX is not None
+"""Whether handlers are required to accept variable keyword arguments"""
+
+_HANDLER_CHECKED_PARAMETERS = tuple(_HANDLER_PARAMETERS[:_HANDLER_ELLIPSIS_INDEX])
+"""The handler parameters that need to be compared against a function's parameters"""
+
+_HANDLER_PARAMETER_SPECIFICATIONS: Tuple[Tuple[Type, bool], ...] = tuple(
+    (parameter, typing.get_origin(parameter) is not None)
+    for parameter in _HANDLER_CHECKED_PARAMETERS
+)
+"""Each handler parameter that needs to be checked paired with whether it is a generic type"""
+
+_HANDLER_RETURN_ORIGIN = typing.get_origin(_HANDLER_RETURN_TYPE)
+"""The generic origin of the handler return type (i.e. `Union` for `Optional[MessageProtocol]`)"""
+
+_HANDLER_RETURN_ARGUMENTS: Tuple[Type, ...] = tuple(
+    argument
+    for argument in (typing.get_args(_HANDLER_RETURN_TYPE) if _HANDLER_RETURN_ORIGIN else (_HANDLER_RETURN_TYPE,))
+    if isinstance(argument, type)
+)
+"""The concrete types that a handler may state that it returns"""
+
+
+def is_hashable(value) -> bool:
+    """
+    Checks to see if a value is hashable by trying to hash it. This avoids the `typing.Hashable` ABC check, which
+    is slower and accepts values like tuples of lists that will still fail to hash
+
+    Args:
+        value: The value to check
+
+    Returns:
+        Whether the value is hashable
+    """
+    try:
+        hash(value)
+    except TypeError:
+        return False
+
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def _type_implements_protocol(checked_type: type, protocol: type) -> bool:
+    """
+    Checks if a type implements a runtime checkable protocol. Results are cached since a protocol check needs to
+    look for every member of the protocol on the type
+
+    Args:
+        checked_type: The type to check
+        protocol: The protocol that the type should comply with
+
+    Returns:
+        Whether the type complies with the protocol
+    """
+    return issubclass(checked_type, protocol)
+
+
+def is_message(value) -> bool:
+    """
+    Checks to see if a value is either a message or a type of message
+
+    Args:
+        value: The object or type to check
+
+    Returns:
+        Whether the value complies with the `MessageProtocol`
+    """
+    checked_type = value if isinstance(value, type) else type(value)
+    return _type_implements_protocol(checked_type, MessageProtocol)
+
 
 def event_handler(aliases: Union[str, List[str]]):
     if isinstance(aliases, str):
         aliases = [aliases]
 
     def decorate_function(function: HANDLER_FUNCTION):
-        enforce_handler(function)
+        # Validation is a development time contract check, so it may be skipped when running optimized or
+        # when it has been turned off
+        if __debug__ and settings.validate_handlers:
+            enforce_handler(function)
+
         alias_copy = aliases.copy()
         alias_copy.append(function.__name__)
         setattr(function, "aliases", alias_copy)
@@ -364,6 +520,35 @@ def event_handler(aliases: Union[str, List[str]]):
     return decorate_function
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_origin(type_definition) -> typing.Optional[Type]:
+    """
+    A cached version of `typing.get_origin` - the same handful of type definitions are inspected for every handler
+
+    Args:
+        type_definition: The type whose origin to find
+
+    Returns:
+        The unsubscripted version of the type, if it has one
+    """
+    return typing.get_origin(type_definition)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_args(type_definition) -> Tuple[Any, ...]:
+    """
+    A cached version of `typing.get_args` - the same handful of type definitions are inspected for every handler
+
+    Args:
+        type_definition: The type whose arguments to find
+
+    Returns:
+        The arguments that the type was subscripted with
+    """
+    return typing.get_args(type_definition)
+
+
+@functools.lru_cache(maxsize=1024)
 def type_matches_special_form(
     encountered_type: Type,
     expected_type: Union,
@@ -393,33 +578,119 @@ def type_matches_special_form(
         check_origin = True
 
     if check_origin:
-        origin = typing.get_origin(expected_type)
+        origin = _get_origin(expected_type)
 
         if origin is None:
             raise Exception(
                 f"`type_matches_special_form` is called incorrectly - the expected type does not identify an origin"
             )
 
-    if typing.get_origin(encountered_type) is not None:
-        for member_type in typing.get_args(encountered_type):
-            if type_matches_special_form(member_type, expected_type, False):
+    # Bind the introspection functions locally since they are called for every entry in the worklist
+    get_origin = _get_origin
+    get_args = _get_args
+
+    # Walk through the type definitions with a worklist rather than recursion - each entry is a pair of
+    # an encountered type and an expected generic type that it might match
+    pending_comparisons: List[Tuple[Type, Type]] = [(encountered_type, expected_type)]
+    add_comparison = pending_comparisons.append
+
+    while pending_comparisons:
+        current_type, current_expectation = pending_comparisons.pop()
+
+        if get_origin(current_type) is not None:
+            for member_type in get_args(current_type):
+                add_comparison((member_type, current_expectation))
+            continue
+
+        for expected_argument in get_args(current_expectation):
+            if get_origin(expected_argument) is not None:
+                add_comparison((current_type, expected_argument))
+            elif current_type == expected_argument:
                 return True
+
+    return False
+
+
+@functools.lru_cache(maxsize=256)
+def _get_cached_signature(function: typing.Callable) -> inspect.Signature:
+    """
+    A cached version of `inspect.signature`
+
+    Args:
+        function: The callable whose signature to find
+
+    Returns:
+        The signature for the callable
+    """
+    return inspect.signature(function)
+
+
+def _get_signature(function: typing.Callable) -> inspect.Signature:
+    """
+    Get the signature of a callable, reusing a previously found signature if possible
+
+    Args:
+        function: The callable whose signature to find
+
+    Returns:
+        The signature for the callable
+    """
+    try:
+        return _get_cached_signature(function)
+    except TypeError:
+        # Unhashable callables can't be cached
+        return inspect.signature(function)
+
+
+def _safe_issubclass(checked_type, parent_type: typing.Union[type, Tuple[type, ...]]) -> bool:
+    """
+    Checks to see if one type is a subclass of another without erroring when given something like a special form
+
+    Args:
+        checked_type: The type that may be a subclass
+        parent_type: The type or types that may be a parent
+
+    Returns:
+        Whether the checked type is a subclass of the parent type
+    """
+    if not isinstance(checked_type, type):
         return False
 
-    expected_arguments = typing.get_args(expected_type)
+    try:
+        return issubclass(checked_type, parent_type)
+    except TypeError:
+        # Protocols with non-method members can't be used with `issubclass`
+        return False
 
-    for expected_argument in expected_arguments:
-        if expected_type == Any:
-            return True
-        argument_origin = typing.get_origin(expected_argument)
 
-        if argument_origin:
-            subtype_matches = type_matches_special_form(encountered_type, expected_argument)
-            if subtype_matches:
-                return True
-        else:
-            if encountered_type == expected_argument:
-                return True
+def _return_annotation_is_valid(return_annotation) -> bool:
+    """
+    Checks to see if a function's return annotation is compatible with what a handler is supposed to return
+
+    Args:
+        return_annotation: The return annotation from a function signature
+
+    Returns:
+        Whether the annotation is missing or describes something a handler may return
+    """
+    if return_annotation is _EMPTY_ANNOTATION:
+        return True
+
+    annotation_origin = _get_origin(return_annotation)
+
+    if annotation_origin is None:
+        candidates = (return_annotation,)
+    elif annotation_origin is _HANDLER_RETURN_ORIGIN:
+        # Both are generic - `Optional[Message]` matches `Optional[MessageProtocol]` but `Final[Message]` does not
+        candidates = _get_args(return_annotation)
+    else:
+        return False
+
+    for candidate in candidates:
+        if isinstance(candidate, _HANDLER_RETURN_ARGUMENTS):
+            return True
+        if _safe_issubclass(candidate, _HANDLER_RETURN_ARGUMENTS):
+            return True
 
     return False
 
@@ -436,131 +707,142 @@ def enforce_handler(possible_handler: typing.Callable) -> HANDLER_FUNCTION:
     Returns:
         The original handler
     """
-    if not isinstance(possible_handler, Callable):
+    if not callable(possible_handler):
         raise ValueError(
             f"The given handler is not valid - "
             f"{str(possible_handler)} ({type(possible_handler)}) is not a callable object"
         )
 
-    required_parameters, return_type = typing.get_args(HANDLER_FUNCTION)
+    try:
+        if possible_handler in _VALIDATED_HANDLERS:
+            return possible_handler
+    except TypeError:
+        # Unhashable handlers can't be remembered, so they are always checked
+        pass
+
+    signature = _get_signature(possible_handler)
+    function_parameters: List[inspect.Parameter] = list()
+
+    # The number of parameters that may be passed before *args or **kwargs start absorbing the rest
+    parameter_count: Optional[int] = None
+    accepts_kwargs = False
+    is_annotated = signature.return_annotation is not _EMPTY_ANNOTATION
+
+    # Gather everything needed about the parameters in a single pass
+    for parameter in signature.parameters.values():
+        if parameter.kind in _VARYING_KINDS:
+            if parameter_count is None:
+                parameter_count = len(function_parameters)
+            if parameter.kind is _VAR_KEYWORD:
+                accepts_kwargs = True
 
-    signature = inspect.signature(possible_handler)
-    function_parameters: List[inspect.Parameter] = [parameter for parameter in signature.parameters.values()]
+        if parameter.annotation is not _EMPTY_ANNOTATION:
+            is_annotated = True
 
-    function_kwargs = [
-        parameter
-        for parameter in function_parameters
-        if parameter.kind == parameter.VAR_KEYWORD
-    ]
+        function_parameters.append(parameter)
 
-    if Ellipsis in required_parameters and not function_kwargs:
+    if _HANDLER_REQUIRES_KWARGS and not accepts_kwargs:
         raise ValueError(
             f"The given handler is not valid - "
             f"variable keyword arguments are required and {str(possible_handler)} doesn't accept them."
         )
 
-    for index, required_parameter in enumerate(required_parameters):  # type: int, Type
-        if required_parameter == Any:
-            continue
+    # Handlers that accept *args or **kwargs can absorb anything past their named parameters
+    if parameter_count is None and len(function_parameters) < len(_HANDLER_PARAMETER_SPECIFICATIONS):
+        raise ValueError(
+            f"The given handler is not valid - "
+            f"{len(_HANDLER_PARAMETER_SPECIFICATIONS)} parameters are required "
+            f"but {str(possible_handler)} only accepts {len(function_parameters)} parameters"
+        )
 
-        matching_parameter = function_parameters[index] if index < len(function_parameters) else None
-        if matching_parameter:
-            varying_kinds = (matching_parameter.VAR_POSITIONAL, matching_parameter.VAR_KEYWORD)
-        else:
-            varying_kinds = tuple()
+    # There is nothing to compare against if the handler doesn't annotate anything
+    parameter_specifications = _HANDLER_PARAMETER_SPECIFICATIONS if is_annotated else tuple()
 
-        parameter_is_variable = matching_parameter is not None and matching_parameter.kind in varying_kinds
-        if required_parameter == Ellipsis and (matching_parameter is None or parameter_is_variable):
-            break
+    for index, (required_parameter, parameter_is_generic) in enumerate(parameter_specifications):
+        if required_parameter is Any:
+            continue
 
         matching_parameter = function_parameters[index]
         annotated_type = matching_parameter.annotation
 
-        if matching_parameter.kind in (matching_parameter.VAR_POSITIONAL, matching_parameter.VAR_KEYWORD):
+        if matching_parameter.kind in _VARYING_KINDS:
             break
 
-        if annotated_type == matching_parameter.empty:
+        if annotated_type is _EMPTY_ANNOTATION:
             continue
 
-        if not (isinstance(annotated_type, required_parameter) or issubclass(annotated_type, required_parameter)):
+        if parameter_is_generic:
+            if not type_matches_special_form(annotated_type, required_parameter):
+                raise ValueError(
+                    f"The given handler is not valid - "
+                    f"Parameter {index} needs to match {str(required_parameter)} but was a {str(annotated_type)}"
+                )
+        elif not (isinstance(annotated_type, required_parameter) or _safe_issubclass(annotated_type, required_parameter)):
             raise ValueError(
                 f"The given handler is not valid - "
                 f"Parameter {index} needs to be a {str(required_parameter)} "
                 f"but expects a {str(matching_parameter.annotation)}"
             )
 
-        if typing.get_origin(required_parameter) is not None and not type_matches_special_form(annotated_type, required_parameter):
-            raise ValueError(
-                f"The given handler is not valid - "
-                f"Parameter {index} needs to match {str(required_parameter)} but was a {str(annotated_type)}"
-            )
-
-    signature_has_return = signature.return_annotation != signature.empty
-
-    if typing.get_origin(return_type) is None and typing.get_origin(signature.return_annotation) is None:
-        return_values_match = isinstance(signature.return_annotation, return_type)
-        return_value_is_a_subclass = issubclass(signature.return_annotation, return_type)
-    elif typing.get_origin(signature.return_annotation) is None:
-        # The return type is a generic and the annotation is not,
-        # so this needs to be compared with 'type_matches_special_form'
-        return_values_match = isinstance(signature.return_annotation, typing.get_args(return_type))
-        return_value_is_a_subclass = issubclass(signature.return_annotation, typing.get_args(return_type))
-    elif typing.get_origin(return_type) is None:
-        # The annotation is generic but the return type is not. A judgement call needs to be made on whether
-        # this is valid. If the given function returns a string or int and the expected return is an int,
-        # this is not correct
-        return_values_match = False
-        return_value_is_a_subclass = False
-    else:
-        # Both are generic and this requires more care - we want it to be true if both return 'optional[int]'
-        # but false if one returns 'Final[int]'
-        encountered_origin = typing.get_origin(signature.return_annotation)
-        expected_origin = typing.get_origin(return_type)
-        if encountered_origin != expected_origin:
-            return_values_match = False
-            return_value_is_a_subclass = False
-        else:
-            encountered_arguments = typing.get_args(signature.return_annotation)
-            expected_arguments = typing.get_args(return_type)
-            return_values_match = False
-            return_value_is_a_subclass = False
-
-            for encountered_argument in encountered_arguments:
-                if isinstance(encountered_argument, expected_arguments):
-                    return_values_match = True
-                if issubclass(encountered_argument, expected_arguments):
-                    return_value_is_a_subclass = True
-
-    if signature_has_return and not (return_values_match or return_value_is_a_subclass):
+    if not _return_annotation_is_valid(signature.return_annotation):
         raise ValueError(
-            f"The given handler is not valid - it must return some form of {return_type.__name__} "
+            f"The given handler is not valid - it must return some form of {_HANDLER_RETURN_TYPE.__name__} "
             f"but the given handler instead returns a {signature.return_annotation.__name__}"
         )
 
+    try:
+        # Remember the handler so that later checks on the same object may be skipped
+        _VALIDATED_HANDLERS.add(possible_handler)
+    except TypeError:
+        # Builtins and unhashable objects can't be weakly referenced, so they will just need to be checked again
+        pass
+
     return possible_handler
 
 
-def get_module_from_globals(module_name: str) -> typing.Optional[ModuleType]:
-    if not module_name:
-        return None
+@functools.lru_cache(maxsize=None)
+def _load_module(module_name: str) -> ModuleType:
+    """
+    Find or import a module by name
 
-    split_name = module_name.strip().split(".")
+    Args:
+        module_name: The fully qualified name of the module
 
-    place_to_search = globals()
+    Returns:
+        The loaded module
+    """
+    # `sys.modules` already holds everything that has been imported, and `importlib` guards new imports with a lock
+    module = sys.modules.get(module_name) or importlib.import_module(module_name)
 
-    for name_part in split_name:
-        if isinstance(place_to_search, typing.Mapping):
-            place_to_search = place_to_search.get(name_part, dict())
-        else:
-            place_to_search = getattr(place_to_search, name_part, dict())
+    if module is None:
+        raise Exception(
+            f"No modules could be found at {module_name}."
+            f"Please check the configuration to check to see if it was correct."
+        )
 
-    return place_to_search if place_to_search else None
+    return module
+
+
+@functools.lru_cache(maxsize=None)
+def _load_code(module_name: str, name: str) -> typing.Any:
+    """
+    Find an object within a module. Objects that can't be found raise an AttributeError rather than returning
+    `None` so that misses aren't cached
+
+    Args:
+        module_name: The fully qualified name of the module containing the object
+        name: The name of the object within the module
+
+    Returns:
+        The found object
+    """
+    return getattr(_load_module(module_name), name)
 
 
 def get_code(
     designation: DesignationProtocol,
     base_class: typing.Type[T] = None
-) -> typing.Union[typing.Type[T], typing.Callable, typing.Tuple[str, typing.Any]]:
+) -> typing.Union[typing.Type[T], typing.Callable, typing.Any]:
     """
     Find an object based off a module name and name
 
@@ -571,42 +853,22 @@ def get_code(
     Returns:
         A type, variable, or
     """
-    if designation.module_name in _IMPORTED_LIBRARIES:
-        module = _IMPORTED_LIBRARIES[designation.module_name]
-    else:
-        module = get_module_from_globals(designation.module_name)
-
-        if module is None:
-            module = importlib.import_module(designation.module_name)
-            _IMPORTED_LIBRARIES[designation.module_name] = module
+    try:
+        code = _load_code(designation.module_name, designation.name)
+    except AttributeError:
+        code = None
 
-    if module is None:
+    # A missing object is reported here rather than letting the base class check below trip over `None`
+    if code is None:
         raise Exception(
-            f"No modules could be found at {designation.module_name}."
-            f"Please check the configuration to check to see if it was correct."
+            f"No valid types or functions could be found in {designation.module_name}. "
+            f"Please check the configuration."
         )
 
-    code = getattr(module, designation.name, None)
-
-    if code is None:
-        members = [
-            (member_name, member)
-            for member_name, member in inspect.getmembers(module)
-            if member_name == designation.name
-        ]
-
-        if len(members) > 0:
-            code = members[0]
-
-    if base_class and not (issubclass(code, base_class) or isinstance(code, base_class)):
+    if base_class and not (isinstance(code, type) and issubclass(code, base_class) or isinstance(code, base_class)):
         raise ValueError(
             f"The found object ('{str(code)}') from '{str(designation)}' "
             f"does not match the required base class ('{str(base_class)}')"
         )
 
-    if code is not None:
-        return code
-
-    raise Exception(
-        f"No valid types or functions could be found in {designation.module_name}. Please check the configuration."
-    )
+    return code
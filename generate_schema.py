@@ -16,6 +16,9 @@ DEFAULT_SCHEMA_PATH = os.environ.get("EVENT_STREAM_SCHEMA_PATH", "schema.json")
 
 
 class Arguments(object):
+    # Arguments are set once and only read afterwards, so instances don't need a `__dict__`
+    __slots__ = ("__path", "__pipe")
+
     def __init__(self, *args):
         # Replace '__option' with any of the expected arguments
         self.__path: typing.Optional[pathlib.Path] = None
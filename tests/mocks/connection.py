@@ -5,8 +5,11 @@ from __future__ import annotations
 
 import typing
 
+from functools import lru_cache
+
 from fakeredis.aioredis import FakeRedis as FakeAsyncRedis
 from fakeredis import FakeRedis
+from fakeredis import FakeServer
 
 from redis import Redis
 from redis.asyncio import Redis as AsyncRedis
@@ -14,30 +17,59 @@ from redis.asyncio import Redis as AsyncRedis
 from event_stream.configuration.redis import RedisConfiguration
 from event_stream.utilities import communication
 
+FAKE_SERVER = FakeServer()
+"""
+The in-memory server behind every fake connection, so that synchronous and asynchronous connections see the same data
+"""
+
+
 class FakeRedisConfiguration(RedisConfiguration):
     def connect(self) -> Redis:
         return Redis()
 
 
+@lru_cache(maxsize=None)
+def get_real_connection(logical_database: int) -> typing.Optional[Redis]:
+    """
+    Get a shared connection to a locally running redis instance, if there is one
+
+    Probing for an instance costs a full connection attempt, so the answer is only found once per database
+
+    Args:
+        logical_database: The number of the logical database to connect to
+
+    Returns:
+        A connection to the local redis instance or None if there isn't a usable instance
+    """
+    connection = Redis(db=logical_database)
+
+    if communication.connection_is_valid(connection):
+        return connection
+
+    return None
+
+
 def get_async_connection(logical_database: int = None) -> typing.Union[FakeAsyncRedis, AsyncRedis]:
     if logical_database is None:
         logical_database = 5
 
-    connection = Redis(db=logical_database)
+    connection = get_real_connection(logical_database)
 
-    if communication.connection_is_valid(connection):
+    # Asynchronous connection pools are tied to the event loop that used them, and every test runs on its own loop,
+    # so only the connection details may be shared
+    if connection is not None:
         return AsyncRedis(**connection.connection_pool.connection_kwargs)
 
-    return FakeAsyncRedis(db=logical_database)
+    return FakeAsyncRedis(server=FAKE_SERVER, db=logical_database)
 
 
 def get_connection(logical_database: int = None) -> typing.Union[FakeRedis, Redis]:
     if logical_database is None:
         logical_database = 5
 
-    connection = Redis(db=logical_database)
+    connection = get_real_connection(logical_database)
 
-    if communication.connection_is_valid(connection):
+    if connection is not None:
         return connection
 
-    return FakeRedis(db=logical_database)
+    return FakeRedis(server=FAKE_SERVER, db=logical_database)
@@ -94,6 +94,16 @@ TEST_DICTIONARY = {
 }
 
 
+def coerce_to_int(value) -> int:
+    """
+    Convert a value into an integer, falling back to the sum of the character codes of its string form
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return sum(map(ord, str(value)))
+
+
 class TestCommon(unittest.TestCase):
     def test_generate_identifier(self):
         default_identifier = common.generate_identifier()
@@ -107,8 +117,8 @@ class TestCommon(unittest.TestCase):
 
         random_length = random.randint(3, 10)
         random_count = random.randint(3, 10)
-        separator = "".join([random.choice(string.punctuation) for _ in range(4)])
-        sample_set = list({random.choice(string.printable) for _ in range(8)})
+        separator = "".join(random.choices(string.punctuation, k=4))
+        sample_set = random.sample(string.printable, k=random.randint(4, 8))
 
         random_groups = common.generate_identifier(
             length=random_length,
@@ -140,60 +150,28 @@ class TestCommon(unittest.TestCase):
         function_with_both_list = list()
 
         def predicate(value) -> bool:
-            try:
-                new_value = int(value)
-            except:
-                new_value = sum([
-                    ord(character)
-                    for character in str(value)
-                ])
-
-            return new_value % 2 == 1
+            return coerce_to_int(value) % 2 == 1
 
         def plain_function(value):
-            try:
-                new_value = int(value)
-            except:
-                new_value = sum([
-                    ord(character)
-                    for character in str(value)
-                ])
+            new_value = coerce_to_int(value)
 
             plain_function_list.append(new_value)
             return new_value
 
         def function_with_args(value, *args):
-            try:
-                new_value = int(value)
-            except:
-                new_value = sum([
-                    ord(character)
-                    for character in str(value)
-                ])
+            new_value = coerce_to_int(value)
 
             function_with_args_list.extend(args)
             return new_value
 
         def function_with_kwargs(value, **kwargs):
-            try:
-                new_value = int(value)
-            except:
-                new_value = sum([
-                    ord(character)
-                    for character in str(value)
-                ])
+            new_value = coerce_to_int(value)
 
             function_with_kwargs_list.append(kwargs)
             return new_value
 
         def function_with_both(value, *args, **kwargs):
-            try:
-                new_value = int(value)
-            except:
-                new_value = sum([
-                    ord(character)
-                    for character in str(value)
-                ])
+            new_value = coerce_to_int(value)
 
             function_with_both_list.append((args, kwargs))
             return new_value
@@ -373,6 +351,37 @@ class TestCommon(unittest.TestCase):
         decoded_data = common.decode_stream_message(original_data)
         self.assertEqual(expected_data, decoded_data)
 
+    def test_compress_fields(self):
+        large_value = json.dumps({"values": list(range(200))})
+        original_data = {
+            "event": "example",
+            "data": large_value,
+            "count": 9
+        }
+
+        compressed_data = common.compress_fields(dict(original_data), threshold=512)
+        self.assertIn(common.COMPRESSED_FIELDS_KEY, compressed_data)
+        self.assertEqual(compressed_data['event'], "example")
+        self.assertLess(len(compressed_data['data']), len(large_value))
+
+        decoded_data = common.decode_stream_message(compressed_data)
+        self.assertEqual(decoded_data, {"event": "example", "data": {"values": list(range(200))}, "count": 9})
+
+    def test_compress_binary_fields(self):
+        # Repeated bytes that aren't valid UTF-8 compress well, so they are guaranteed to be compressed
+        binary_value = bytes([0xFF, 0xFE, 0x00, 0x81]) * 256
+        original_data = {
+            "event": "example",
+            "data": binary_value
+        }
+
+        compressed_data = common.compress_fields(dict(original_data), threshold=512)
+        self.assertIn(common.COMPRESSED_FIELDS_KEY, compressed_data)
+        self.assertLess(len(compressed_data['data']), len(binary_value))
+
+        decoded_data = common.decode_stream_message(compressed_data)
+        self.assertEqual(decoded_data, {"event": "example", "data": binary_value})
+
     def test_instance_of(self):
         self.assertTrue(common.instanceof(8, int))
         self.assertFalse(common.instanceof("bool", bool))
@@ -386,6 +395,13 @@ class TestCommon(unittest.TestCase):
         self.assertTrue(common.instanceof({"value1": 1, "value2": 2}, typing.Dict[str, int]))
         self.assertFalse(common.instanceof({"value1": 1, "value2": 2}, typing.Dict[str, bool]))
 
+        self.assertTrue(common.instanceof([1, 'a', 4, False], typing.Sequence[int], deep=False))
+        self.assertFalse(common.instanceof(['a', 1, 4, False], typing.Sequence[int], deep=False))
+
+        generator = (value for value in range(5))
+        self.assertTrue(common.instanceof(generator, typing.Iterable[int]))
+        self.assertEqual(list(generator), [0, 1, 2, 3, 4])
+
     def test_generate_group_name(self):
         stream_name = "UNITTEST"
         application_name = "UnitTest"
@@ -449,6 +465,22 @@ class TestCommon(unittest.TestCase):
         self.assertIn(ChildTwo, subclasses)
         self.assertIn(ChildOne, subclasses)
 
+    def test_get_concrete_subclasses_with_diamond_inheritance(self):
+        class Root:
+            pass
+
+        class Left(Root):
+            pass
+
+        class Right(Root):
+            pass
+
+        class Bottom(Left, Right):
+            pass
+
+        subclasses = list(common.get_concrete_subclasses(Root))
+        self.assertEqual(subclasses, [Left, Bottom, Right])
+
 
 async def recursive_async_function(value, *args, add_amount: int = 0.7, **kwargs):
     if value <= 0:
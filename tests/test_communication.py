@@ -6,7 +6,10 @@ from __future__ import annotations
 import dataclasses
 import typing
 
+from asyncio import AbstractEventLoopPolicy
 from asyncio import gather
+from asyncio import get_event_loop_policy
+from asyncio import set_event_loop_policy
 from asyncio import sleep
 
 import unittest
@@ -30,10 +33,31 @@ CONSUMER_NAME = f"{GROUP_NAME}:Consumer"
 APPLICATION_NAME = "UnitTest"
 LISTENER_NAME = "Test"
 
+_PREVIOUS_EVENT_LOOP_POLICY: typing.Optional[AbstractEventLoopPolicy] = None
+"""The event loop policy that was in place before this module's tests started"""
+
+
+def setUpModule():
+    # Each test still gets its own loop since redis connection pools are tied to the loop that first used them, but
+    # those loops are made with uvloop when it's installed, just like in the application
+    global _PREVIOUS_EVENT_LOOP_POLICY
+    _PREVIOUS_EVENT_LOOP_POLICY = get_event_loop_policy()
+    communication.install_fast_event_loop()
+
+
+def tearDownModule():
+    # Tests in other modules shouldn't be affected by the loops used here
+    set_event_loop_policy(_PREVIOUS_EVENT_LOOP_POLICY)
+
 
 class StreamData:
     def __init__(self):
+        # Every name derives from the stream name, so they are all worked out once up front
         self.__stream_name = common.generate_identifier(length=5)
+        self.__group_name = f"{self.__stream_name}:Group"
+        self.__consumer_name = f"{self.__group_name}:Consumer"
+        self.__competing_consumer_name = f"{self.__group_name}:Competitor"
+        self.__consumer_names = frozenset((self.__consumer_name, self.__competing_consumer_name))
 
     @property
     def stream_name(self) -> str:
@@ -41,22 +65,19 @@ class StreamData:
 
     @property
     def group_name(self) -> str:
-        return f"{self.stream_name}:Group"
+        return self.__group_name
 
     @property
     def consumer_name(self) -> str:
-        return f"{self.group_name}:Consumer"
+        return self.__consumer_name
 
     @property
     def competing_consumer_name(self) -> str:
-        return f"{self.group_name}:Competitor"
+        return self.__competing_consumer_name
 
     @property
-    def consumer_names(self) -> typing.Set[str]:
-        return {
-            self.consumer_name,
-            self.competing_consumer_name
-        }
+    def consumer_names(self) -> typing.FrozenSet[str]:
+        return self.__consumer_names
 
 
 
@@ -77,12 +98,7 @@ class TestCommunication(unittest.IsolatedAsyncioTestCase):
         self.streams = set()
 
     async def asyncTearDown(self) -> None:
-        await gather(
-            *[
-                communication.remove_stream(connection=self.async_connection, stream_name=stream_name)
-                for stream_name in self.streams
-            ]
-        )
+        await communication.remove_streams(connection=self.async_connection, stream_names=self.streams)
 
     def get_stream_name(self) -> str:
         stream_name = common.generate_identifier(length=5)
@@ -91,17 +107,11 @@ class TestCommunication(unittest.IsolatedAsyncioTestCase):
 
     async def get_stream(self) -> StreamData:
         stream = StreamData()
-        added_consumer = await communication.add_consumer(
-            connection=self.async_connection,
-            stream_name=stream.stream_name,
-            group_name=stream.group_name,
-            consumer_name=stream.consumer_name
-        )
-        added_competitor = await communication.add_consumer(
+        added_consumers, added_group = await communication.add_consumers(
             connection=self.async_connection,
             stream_name=stream.stream_name,
             group_name=stream.group_name,
-            consumer_name=stream.competing_consumer_name
+            consumer_names=[stream.consumer_name, stream.competing_consumer_name]
         )
         self.streams.add(stream.stream_name)
 
@@ -134,14 +144,25 @@ class TestCommunication(unittest.IsolatedAsyncioTestCase):
 
     async def insert_messages(self, stream_name: str) -> dict:
 
-        data: typing.Dict[str, typing.Dict[bytes, bytes]] = dict()
+        input_values: typing.List[typing.Dict[bytes, bytes]] = [
+            {
+                common.generate_identifier(length=8).encode():
+                    common.generate_identifier(length=4, group_count=2, separator="-").encode()
+            }
+            for _ in range(5)
+        ]
+
+        # Add every message in a single round trip
+        async with self.async_connection.pipeline(transaction=False) as pipeline:
+            for input_value in input_values:
+                pipeline.xadd(stream_name, input_value)
+
+            message_ids: typing.List[bytes] = await pipeline.execute()
 
-        for _ in range(5):
-            key = common.generate_identifier(length=8).encode()
-            value = common.generate_identifier(length=4, group_count=2, separator="-").encode()
-            input_value = {key: value}
-            message_id: bytes = await self.async_connection.xadd(stream_name, {key: value})
-            data[message_id.decode()] = input_value
+        data: typing.Dict[str, typing.Dict[bytes, bytes]] = {
+            message_id.decode(): input_value
+            for message_id, input_value in zip(message_ids, input_values)
+        }
 
         return data
 
@@ -198,33 +219,33 @@ class TestCommunication(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(changed_messages, transferred_messages)
 
-        pending_inbox_messages = await self.async_connection.xpending_range(
-            name=stream.stream_name,
-            groupname=stream.group_name,
-            consumername=settings.consumer_inbox_name,
-            min="-",
-            max="+",
-            count=99
+        # Neither pending list depends on the other, so both may be requested at once
+        pending_inbox_messages, consumer_messages = await gather(
+            self.async_connection.xpending_range(
+                name=stream.stream_name,
+                groupname=stream.group_name,
+                consumername=settings.consumer_inbox_name,
+                min="-",
+                max="+",
+                count=99
+            ),
+            self.async_connection.xpending_range(
+                name=stream.stream_name,
+                groupname=stream.group_name,
+                consumername=stream.consumer_name,
+                min="-",
+                max="+",
+                count=99
+            )
         )
 
-        inbox_message_ids = {
-            message['message_id'].decode()
-            for message in pending_inbox_messages
-        }
-
         self.assertEqual(len(transferred_messages), len(pending_inbox_messages))
 
-        for message_id in inbox_message_ids:
-            self.assertIn(message_id, transferred_messages)
-
-        consumer_messages = await self.async_connection.xpending_range(
-            name=stream.stream_name,
-            groupname=stream.group_name,
-            consumername=stream.consumer_name,
-            min="-",
-            max="+",
-            count=99
+        self.assertSetEqual(
+            {message['message_id'].decode() for message in pending_inbox_messages},
+            set(transferred_messages)
         )
+
         self.assertEqual(len(consumer_messages), 0)
 
     async def test_return_message_to_inbox(self):
@@ -317,6 +338,16 @@ class TestCommunication(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(expected_messages, organized_messages)
 
+    async def test_organize_messages_by_sequence(self):
+        messages = [
+            (b'1687976170775-10', {b'Dea37CD7': b'ce7b-22C9'}),
+            (b'1687976170775-9', {b'2b76bcF6': b'D5FF-310c'}),
+        ]
+
+        organized_messages = communication.organize_messages(messages)
+
+        self.assertEqual(['1687976170775-9', '1687976170775-10'], list(organized_messages))
+
     async def test_read_from_stream(self):
         stream = await self.get_stream()
 
@@ -383,7 +414,7 @@ class TestCommunication(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(inserted_messages, claimed_messages)
 
-        desired_idle_seconds = 3
+        desired_idle_seconds = 0.2
 
         wait_time = desired_idle_seconds * 1.5
 
@@ -395,7 +426,7 @@ class TestCommunication(unittest.IsolatedAsyncioTestCase):
             stream=stream.stream_name,
             group=stream.group_name,
             consumer=stream.competing_consumer_name,
-            idle_time=desired_idle_seconds * 1_000
+            idle_time=int(desired_idle_seconds * 1_000)
         )
 
         self.assertEqual(claimed_messages, won_messages)
@@ -416,19 +447,21 @@ class TestCommunication(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(inserted_messages, claimed_messages)
 
-        desired_idle_seconds = 3
-
-        wait_time = desired_idle_seconds * 1.5
-
-        print(f"Waiting for {wait_time}s to generate idle messages")
-        await sleep(wait_time)
+        # Messages left behind by a consumer that shut down are parked in the inbox, which is where dead messages
+        # are looked for first - the idle search is already covered by `test_get_idle_messages`
+        await communication.transfer_messages_to_inbox(
+            connection=self.async_connection,
+            stream_name=stream.stream_name,
+            group_name=stream.group_name,
+            source_consumer=stream.consumer_name,
+            lock_connection=self.connection
+        )
 
-        won_messages = await communication.get_idle_messages(
+        won_messages = await communication.get_dead_messages(
             connection=self.async_connection,
             stream=stream.stream_name,
             group=stream.group_name,
-            consumer=stream.competing_consumer_name,
-            idle_time=desired_idle_seconds * 1_000
+            consumer=stream.competing_consumer_name
         )
 
         self.assertEqual(claimed_messages, won_messages)
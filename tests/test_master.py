@@ -0,0 +1,73 @@
+"""
+Tests for the handlers used by the master bus
+"""
+import json
+import pathlib
+import tempfile
+import typing
+import unittest
+
+from event_stream.handlers import master
+from event_stream.messages.master import TrimMessage
+from event_stream.utilities import common
+from tests.mocks import get_async_connection
+
+
+class FakeReaderConfiguration(typing.NamedTuple):
+    stream: str
+
+
+class FakeReader(typing.NamedTuple):
+    configuration: FakeReaderConfiguration
+
+
+class TestMaster(unittest.IsolatedAsyncioTestCase):
+    async def test_trim_streams_saves_output(self):
+        connection = get_async_connection()
+        stream_name = common.generate_identifier(length=5)
+        reader = FakeReader(configuration=FakeReaderConfiguration(stream=stream_name))
+
+        message_ids = [
+            (await connection.xadd(stream_name, {"index": index})).decode()
+            for index in range(10)
+        ]
+
+        try:
+            with tempfile.TemporaryDirectory() as temporary_directory:
+                # The output directory doesn't exist yet, so the trim has to create it
+                output_path = pathlib.Path(temporary_directory) / "records"
+
+                trim_message = TrimMessage(
+                    count=3,
+                    save_output=True,
+                    output_path=str(output_path),
+                    filename="trimmed.jsonl"
+                )
+
+                await master.trim_streams(connection, reader, trim_message)
+
+                self.assertEqual(await connection.xlen(stream_name), 3)
+
+                # A second trim with the same filename should add to the archive rather than replace it
+                await connection.xadd(stream_name, {"index": 10})
+                await master.trim_streams(connection, reader, trim_message)
+
+                remaining_ids = [
+                    record_id.decode()
+                    for record_id, _ in await connection.xrange(stream_name)
+                ]
+
+                records = [
+                    json.loads(line)
+                    for line in (output_path / "trimmed.jsonl").read_text().splitlines()
+                ]
+        finally:
+            await connection.delete(stream_name)
+
+        self.assertEqual(
+            records,
+            [{message_id: {"index": index}} for index, message_id in enumerate(message_ids[:8])]
+        )
+
+        self.assertEqual(remaining_ids, [*message_ids[8:], remaining_ids[-1]])
+        self.assertEqual(len(remaining_ids), 3)
@@ -2,9 +2,15 @@
 @TODO: Put a module wide description here
 """
 import json
+import typing
 import unittest
 
+from unittest import mock
+
+from pydantic import BaseModel
+
 import messages
+from messages import base
 from messages import Message
 from messages import GenericMessage
 from messages.examples import ExampleMessage
@@ -12,15 +18,39 @@ from messages.master import TrimMessage
 from messages.examples import ValueEvent
 from messages.examples import ExampleEvent
 from messages.examples import TypedJSONMessage
+from event_stream.utilities import common
+from tests.mocks import get_async_connection
+
+VALUE_MESSAGE = {
+    "event": "value test",
+    "example_body_value": 1
+}
+"""A message that should be parsed as a `ValueEvent` - shared by tests that only read it"""
+
+
+class KeyedValues(BaseModel):
+    values_by_index: typing.Dict[int, str]
+
+
+class KeyedValueMessage(Message):
+    """
+    A message whose fields can't be serialized by orjson without extra options
+    """
+    indexed_values: typing.Dict[int, str]
+    keyed_values: KeyedValues
+    large_values: typing.List[int]
+
+
+class BulkMessage(Message):
+    """
+    A message with a payload large enough to be compressed
+    """
+    index: int
+    payload: str
 
 
 class TestMessages(unittest.TestCase):
     def test_generic_message(self):
-        value_message = {
-            "event": "value test",
-            "example_body_value": 1
-        }
-
         example_message = {
             "event": "example test",
             "example_data": '{"example": 3}'
@@ -39,7 +69,7 @@ class TestMessages(unittest.TestCase):
             "event": "trim"
         }
 
-        parsed_value_message: messages.Message = messages.parse(value_message)
+        parsed_value_message: messages.Message = messages.parse(VALUE_MESSAGE)
         parsed_example_message: messages.Message = messages.parse(example_message)
         parsed_generic_message: messages.Message = messages.parse(generic_message)
         parsed_trim_message: messages.Message = messages.parse(trim_message)
@@ -55,11 +85,6 @@ class TestMessages(unittest.TestCase):
             "data": "[1, 2, 3]"
         }
 
-        value_message = {
-            "event": "value test",
-            "example_body_value": 1
-        }
-
         generic_message = {
             "event": "generic test",
             "data": {
@@ -70,7 +95,7 @@ class TestMessages(unittest.TestCase):
 
         typed_payload_data = {
             "event": "payload testing",
-            "data": json.dumps(value_message)
+            "data": json.dumps(VALUE_MESSAGE)
         }
 
         parsed_payload_message = messages.parse(payload_data)
@@ -80,3 +105,73 @@ class TestMessages(unittest.TestCase):
         self.assertEqual(type(parsed_payload_message), ExampleMessage)
         self.assertEqual(type(parsed_typed_payload_message), TypedJSONMessage)
         self.assertEqual(type(parsed_generic_message), GenericMessage)
+
+    def test_non_string_keys(self):
+        message = KeyedValueMessage(
+            event="keyed values",
+            indexed_values={1: "a", 2: "b"},
+            keyed_values=KeyedValues(values_by_index={3: "c"}),
+            large_values=[2**70]
+        )
+
+        fields = message.get_stream_fields(
+            "test",
+            include_header=False,
+            application_name="Test",
+            application_instance="1"
+        )
+
+        self.assertEqual(json.loads(fields["indexed_values"]), {"1": "a", "2": "b"})
+        self.assertEqual(json.loads(fields["keyed_values"]), {"values_by_index": {"3": "c"}})
+        self.assertEqual(json.loads(fields["large_values"]), [2**70])
+
+
+class TestSendingMessages(unittest.IsolatedAsyncioTestCase):
+    async def test_send_many(self):
+        connection = get_async_connection()
+        bulk_stream_name = common.generate_identifier(length=5)
+        single_stream_name = common.generate_identifier(length=5)
+
+        bulk_messages = [
+            BulkMessage(event="bulk test", index=index, payload=json.dumps({"values": [index] * 200}))
+            for index in range(5)
+        ]
+
+        try:
+            with mock.patch.object(base.settings, "compression_threshold", 64):
+                await Message.send_many(
+                    connection,
+                    bulk_stream_name,
+                    bulk_messages,
+                    include_header=True,
+                    application_name="Test",
+                    application_instance="1"
+                )
+
+                # The headers were attached by `send_many`, so sending each message on its own should write
+                # exactly the same fields
+                for message in bulk_messages:
+                    await message.send(
+                        connection,
+                        single_stream_name,
+                        include_header=True,
+                        application_name="Test",
+                        application_instance="1"
+                    )
+
+            bulk_records = await connection.xrange(bulk_stream_name)
+            single_records = await connection.xrange(single_stream_name)
+        finally:
+            await connection.delete(bulk_stream_name, single_stream_name)
+
+        self.assertEqual(len(bulk_records), len(bulk_messages))
+        self.assertEqual([fields for _, fields in bulk_records], [fields for _, fields in single_records])
+
+        for index, (_, fields) in enumerate(bulk_records):
+            compressed_field_names = json.loads(fields[common.COMPRESSED_FIELDS_KEY.encode()])
+            self.assertIn("payload", compressed_field_names)
+            self.assertIn(b"header", fields)
+
+            decoded_message = common.decode_stream_message(fields)
+            self.assertEqual(decoded_message["index"], index)
+            self.assertEqual(decoded_message["payload"], {"values": [index] * 200})
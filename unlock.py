@@ -12,7 +12,9 @@ from redis import Redis
 LOCK_LENGTH = 4
 LOCK_TYPE = b'string'
 
-MESSAGE_PATTERN = re.compile(r"\d+-\d+$")
+LOCK_SUFFIX = b"LOCK"
+
+MESSAGE_PATTERN = re.compile(rb"\d+-\d+$")
 
 
 class Arguments(object):
@@ -62,11 +64,12 @@ def main():
 
     while got_approval is False and approval_attempts < max_approval_attempts:
         prompt_answer = input(f"Are you sure you want to clear all locks in {prompt_message}")
+        normalized_answer = prompt_answer.lower()
 
-        if prompt_answer.lower().startswith("y"):
+        if normalized_answer.startswith("y"):
             got_approval = True
             should_clear = True
-        elif prompt_answer.lower().startswith("n"):
+        elif normalized_answer.startswith("n"):
             got_approval = True
             should_clear = False
         else:
@@ -87,23 +90,36 @@ def main():
 
     connection = Redis()
 
-    keys = connection.keys(key_pattern)
+    # SCAN walks the keyspace in steps rather than blocking the server the way KEYS does
+    # Keys stay as bytes until they're printed so that most of them never need to be decoded
+    candidate_keys = [
+        key
+        for key in connection.scan_iter(match=key_pattern, count=1000)
+        if not MESSAGE_PATTERN.search(key) and key.endswith(LOCK_SUFFIX)
+    ]
+
+    if not candidate_keys:
+        return
+
+    # Check the types of every candidate in a single round trip
+    pipeline = connection.pipeline(transaction=False)
 
-    for key in keys:
-        key = key.decode()
+    for key in candidate_keys:
+        pipeline.type(key)
 
-        if MESSAGE_PATTERN.search(key):
-            continue
-        elif not key.endswith("LOCK"):
-            continue
+    lock_keys = [
+        key
+        for key, key_type in zip(candidate_keys, pipeline.execute())
+        if key_type == LOCK_TYPE
+    ]
 
-        key_type = connection.type(key)
+    if not lock_keys:
+        return
 
-        if key_type != LOCK_TYPE:
-            continue
+    connection.delete(*lock_keys)
 
-        connection.delete(key)
-        print(f"Deleted the {key} entry")
+    for key in lock_keys:
+        print(f"Deleted the {key.decode()} entry")
 
 
 if __name__ == "__main__":